@@ -8,14 +8,22 @@ This version calls SSI API directly to get ALL historical data from 2010 to pres
 
 import asyncio
 import logging
+import math
+import os
+import socket
 import sys
 import time
 import argparse
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from pathlib import Path
-import requests
+import httpx
+import numpy as np
+from aiolimiter import AsyncLimiter
+import orjson
+import pandas as pd
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -31,28 +39,142 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Transient upstream statuses worth retrying before counting an error
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+def _is_retryable_status(exc: BaseException) -> bool:
+    """Retry only on throttling and transient gateway errors"""
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in RETRY_STATUS_CODES
+
+# Tracking API field -> SSI field, coerced column-wise per page
+STATS_FLOAT_COLUMNS = {
+    'current_price': 'close',
+    'change_amount': 'priceChanged',
+    'change_percent': 'perPriceChange',
+    'high_price': 'high',
+    'low_price': 'low',
+    'open_price': 'open',
+    'close_price': 'close',
+    'ceiling_price': 'ceilingPrice',
+    'floor_price': 'floorPrice',
+    'ref_price': 'refPrice',
+    'avg_price': 'avgPrice',
+    'close_price_adjusted': 'closePriceAdjusted',
+    'close_raw': 'closeRaw',
+    'open_raw': 'openRaw',
+    'high_raw': 'highRaw',
+    'low_raw': 'lowRaw'
+}
+
+STATS_INT_COLUMNS = {
+    'volume': 'volume',
+    'value': 'totalMatchVal',
+    'total_match_vol': 'totalMatchVol',
+    'total_deal_val': 'totalDealVal',
+    'total_deal_vol': 'totalDealVol',
+    'foreign_buy_vol_total': 'foreignBuyVolTotal',
+    'foreign_current_room': 'foreignCurrentRoom',
+    'foreign_sell_vol_total': 'foreignSellVolTotal',
+    'foreign_buy_val_total': 'foreignBuyValTotal',
+    'foreign_sell_val_total': 'foreignSellValTotal',
+    'foreign_buy_vol_matched': 'foreignBuyVolMatched',
+    'foreign_buy_vol_deal': 'foreignBuyVolDeal',
+    'total_buy_trade': 'totalBuyTrade',
+    'total_buy_trade_vol': 'totalBuyTradeVol',
+    'total_sell_trade': 'totalSellTrade',
+    'total_sell_trade_vol': 'totalSellTradeVol'
+}
+
+def _to_numeric(df: pd.DataFrame, column: str) -> pd.Series:
+    """Coerce an SSI column to numbers, treating blanks, '-' and garbage as missing"""
+    if column not in df:
+        return pd.Series(float('nan'), index=df.index)
+    values = df[column]
+    if values.dtype == object:
+        # Mixed numbers/strings: stringify in C and strip thousands separators in one pass
+        values = values.astype(str).str.replace(',', '', regex=False)
+    return pd.to_numeric(values, errors='coerce')
+
+# Resolved addresses are reused for this long before asking the resolver again
+DNS_CACHE_TTL = 300
+
+def install_dns_cache(ttl: float = DNS_CACHE_TTL):
+    """Cache successful socket.getaddrinfo lookups for ttl seconds, process-wide"""
+    resolve = socket.getaddrinfo
+    cache: Dict[tuple, tuple] = {}
+    
+    def cached_getaddrinfo(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        entry = cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        result = resolve(*args, **kwargs)
+        cache[key] = (now + ttl, result)
+        return result
+    
+    socket.getaddrinfo = cached_getaddrinfo
+
+def _load_cached_symbols(path: Path, ttl: Optional[float]) -> Optional[List[str]]:
+    """Read the cached VN100 symbol list, or None if missing or older than ttl seconds"""
+    try:
+        if ttl is not None and time.time() - path.stat().st_mtime >= ttl:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def _store_cached_symbols(path: Path, symbols: List[str]):
+    """Write the VN100 symbol list atomically so readers never see a partial file"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(orjson.dumps(symbols))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not cache VN100 symbols at {path}: {e}")
+
 @dataclass
 class AutomationConfig:
     """Direct automation configuration"""
     api_base_url: str = "http://localhost:8000"
     ssi_api_url: str = "https://iboard-api.ssi.com.vn/statistics/company/ssmi/stock-info"
+    ssi_charts_url: str = "https://iboard-api.ssi.com.vn/statistics/charts/history"
+    charts_backfill_days: int = 60  # Ranges starting further back are backfilled from charts history
+    charts_batch_size: int = 1000  # Rows per bulk save when backfilling from charts history
     max_symbols: int = 5
     log_level: str = "INFO"
     max_pages_per_symbol: int = 1000  # Safety limit
+    max_concurrent_symbols: int = 10  # Symbols processed at the same time
+    max_concurrent_pages: int = 5  # SSI pages fetched at the same time per symbol
+    ssi_max_requests_per_second: int = 10  # Shared SSI request budget across all workers
+    symbols_cache_path: Path = Path.home() / '.cache' / 'vn100_symbols.json'
+    symbols_cache_ttl: int = 86400  # VN100 composition changes at most quarterly
 
 class DirectVN100Automation:
     """Direct VN100 Automation System calling SSI API directly"""
     
     def __init__(self, config: AutomationConfig):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Referer': 'https://iboard.ssi.com.vn/',
-            'Origin': 'https://iboard.ssi.com.vn'
-        })
+        self.client = httpx.AsyncClient(
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                'Accept': 'application/json, text/plain, */*',
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Referer': 'https://iboard.ssi.com.vn/',
+                'Origin': 'https://iboard.ssi.com.vn'
+            },
+            # Pooled keep-alive transport sized for the concurrent workers; retries connect failures
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                retries=3
+            ),
+            timeout=30
+        )
+        
+        self.validation_results: Dict[str, Dict[str, Any]] = {}
+        self._ssi_limiter = AsyncLimiter(max_rate=config.ssi_max_requests_per_second, time_period=1)
         
         self.stats = {
             'start_time': datetime.now(),
@@ -68,34 +190,50 @@ class DirectVN100Automation:
         logger.setLevel(getattr(logging, config.log_level.upper()))
         logger.info(f"Direct VN100 Automation initialized")
     
-    def _safe_float(self, value: Any) -> Optional[float]:
-        """Safely convert value to float"""
-        if value is None or value == '' or value == '-':
-            return None
-        try:
-            return float(str(value).replace(',', ''))
-        except (ValueError, TypeError):
-            return None
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self.client.aclose()
     
-    def _safe_int(self, value: Any) -> Optional[int]:
-        """Safely convert value to int"""
-        if value is None or value == '' or value == '-':
-            return None
-        try:
-            return int(str(value).replace(',', ''))
-        except (ValueError, TypeError):
-            return None
+    @retry(
+        retry=retry_if_exception(_is_retryable_status),
+        wait=wait_exponential_jitter(initial=0.3, max=8),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, retried with jittered backoff on 429 and 5xx gateway errors"""
+        response = await self.client.request(method, url, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    @retry(
+        retry=retry_if_exception(_is_retryable_status),
+        wait=wait_exponential_jitter(initial=0.3, max=8),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _ssi_get(self, url: str, params: Optional[Dict] = None) -> httpx.Response:
+        """Rate-limited GET against SSI, retried like _request"""
+        async with self._ssi_limiter:
+            response = await self.client.get(url, params=params)
+        response.raise_for_status()
+        return response
     
-    def fetch_vn100_symbols(self) -> List[str]:
-        """Fetch VN100 symbols from SSI API"""
+    async def fetch_vn100_symbols(self) -> List[str]:
+        """Fetch VN100 symbols from SSI API, served from the on-disk cache while fresh"""
+        cache_path = self.config.symbols_cache_path
+        cached = _load_cached_symbols(cache_path, self.config.symbols_cache_ttl)
+        if cached:
+            logger.info(f"Loaded {len(cached)} VN100 symbols from cache {cache_path}")
+            return cached[:self.config.max_symbols]  # Limit for testing
+        
         try:
             logger.info("Fetching VN100 symbols...")
             
             url = "https://iboard-query.ssi.com.vn/stock/group/VN100"
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            response = await self._ssi_get(url)
             
-            data = response.json()
+            data = orjson.loads(response.content)
             symbols = []
             
             if isinstance(data, dict) and 'data' in data:
@@ -111,15 +249,23 @@ class DirectVN100Automation:
                 if symbol:
                     symbols.append(symbol)
             
+            if symbols:
+                _store_cached_symbols(cache_path, symbols)
+            
             logger.info(f"Fetched {len(symbols)} VN100 symbols")
             return symbols[:self.config.max_symbols]  # Limit for testing
             
         except Exception as e:
+            # Fall back to a stale cache when SSI is unreachable
+            stale = _load_cached_symbols(cache_path, None)
+            if stale:
+                logger.warning(f"Error fetching VN100 symbols: {e}; using cached list from {cache_path}")
+                return stale[:self.config.max_symbols]
             logger.error(f"Error fetching VN100 symbols: {e}")
             self.stats['errors'] += 1
             return []
     
-    def get_last_update_date(self, symbol: str) -> Optional[date]:
+    async def get_last_update_date(self, symbol: str) -> Optional[date]:
         """Get the last update date for a symbol from database"""
         try:
             url = f"{self.config.api_base_url}/stock-statistics"
@@ -127,10 +273,10 @@ class DirectVN100Automation:
                 'symbol': symbol
             }
             
-            response = self.session.get(url, params=params, timeout=30)
+            response = await self.client.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             if data and len(data) > 0:
                 # Get the most recent record (first in the list)
                 last_record = data[0]
@@ -144,6 +290,24 @@ class DirectVN100Automation:
             logger.warning(f"Could not get last update date for {symbol}: {e}")
             return None
     
+    async def get_existing_dates(self, symbol: str, start_date: date, end_date: date) -> Optional[frozenset]:
+        """Get the dates the tracking API already stores for a symbol within the range (None if unknown)"""
+        try:
+            url = f"{self.config.api_base_url}/stock-statistics/dates"
+            params = {
+                'symbol': symbol,
+                'from_date': start_date.isoformat(),
+                'to_date': end_date.isoformat()
+            }
+            
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            return frozenset(orjson.loads(response.content))
+            
+        except Exception as e:
+            logger.warning(f"Could not get existing dates for {symbol}: {e}")
+            return None
+    
     def get_last_trading_day(self) -> date:
         """Get the last trading day (skip weekends)"""
         today = date.today()
@@ -158,10 +322,10 @@ class DirectVN100Automation:
         else:
             return today - timedelta(days=1)
     
-    def calculate_date_range(self, symbol: str) -> tuple[date, date]:
+    async def calculate_date_range(self, symbol: str) -> tuple[date, date]:
         """Calculate date range for data fetching"""
         # Get last update date
-        last_update = self.get_last_update_date(symbol)
+        last_update = await self.get_last_update_date(symbol)
         
         # Calculate start date
         if last_update:
@@ -189,180 +353,221 @@ class DirectVN100Automation:
         
         return start_date, end_date
     
-    def fetch_stock_data_direct(self, symbol: str, start_date: date, end_date: date) -> int:
+    async def _fetch_page(self, symbol: str, page: int, page_size: int, start_date: date, end_date: date) -> Dict[str, Any]:
+        """Fetch one page of daily stock info from SSI API"""
+        params = {
+            'symbol': symbol,
+            'page': page,
+            'pageSize': page_size,
+            'fromDate': start_date.strftime('%d/%m/%Y'),
+            'toDate': end_date.strftime('%d/%m/%Y')
+        }
+        
+        logger.debug("Fetching page %s for %s...", page, symbol)
+        response = await self._ssi_get(self.config.ssi_api_url, params=params)
+        return orjson.loads(response.content)
+    
+    async def _save_page(self, symbol: str, page: int, stock_data: Union[List[Dict[str, Any]], pd.DataFrame], start_date: date, end_date: date,
+                         existing_dates: frozenset = frozenset()) -> int:
+        """Save the records of one SSI page through the tracking API, skipping dates it already has"""
+        saved_count = 0
+        logger.debug("Processing page %s for %s: %s records", page, symbol, len(stock_data))
+        
+        df = pd.DataFrame(stock_data)
+        if 'tradingDate' not in df:
+            df['tradingDate'] = None
+        
+        # Parse trading dates in one pass; blank dates are skipped, malformed ones are reported
+        trading_dates = pd.to_datetime(df['tradingDate'], format='%d/%m/%Y', errors='coerce')
+        present = df['tradingDate'].notna() & (df['tradingDate'] != '')
+        for trading_date_str in df.loc[present & trading_dates.isna(), 'tradingDate']:
+            logger.warning("Invalid date format: %s", trading_date_str)
+        
+        # Keep only dates within range that the tracking API does not already have
+        date_strs = trading_dates.dt.strftime('%Y-%m-%d')
+        keep = trading_dates.between(pd.Timestamp(start_date), pd.Timestamp(end_date)) & ~date_strs.isin(existing_dates)
+        df = df[keep]
+        
+        # Prepare data for API
+        stats = pd.DataFrame(index=df.index)
+        stats['symbol'] = symbol
+        stats['date'] = date_strs[keep]
+        for column, source in STATS_FLOAT_COLUMNS.items():
+            stats[column] = _to_numeric(df, source)
+        for column, source in STATS_INT_COLUMNS.items():
+            values = _to_numeric(df, source)
+            stats[column] = values.where(values % 1 == 0).astype('Int64')
+        
+        batch = stats.astype(object).where(stats.notna(), None).to_dict(orient='records')
+        
+        # Save the whole page in one request
+        if batch:
+            try:
+                await self._request(
+                    'POST',
+                    f"{self.config.api_base_url}/stock-statistics/bulk",
+                    content=orjson.dumps(batch),
+                    headers={'Content-Type': 'application/json'},
+                    timeout=60
+                )
+                saved_count = len(batch)
+                
+            except Exception as e:
+                logger.warning("Failed to save %s records from page %s for %s: %s", len(batch), page, symbol, e)
+                self.stats['errors'] += 1
+        
+        logger.debug("Saved %s records from page %s for %s", saved_count, page, symbol)
+        self.stats['total_pages_processed'] += 1
+        return saved_count
+    
+    async def fetch_stock_data_direct(self, symbol: str, start_date: date, end_date: date) -> int:
         """Fetch stock data directly from SSI API with full pagination"""
         try:
-            logger.info(f"Fetching stock data for {symbol} from {start_date} to {end_date}")
+            logger.info("Fetching stock data for %s from %s to %s", symbol, start_date, end_date)
             
-            total_saved = 0
-            page = 1
             page_size = 100
+            # Paginated rows carry every column, so re-saving known dates is harmless when the lookup fails
+            existing_dates = await self.get_existing_dates(symbol, start_date, end_date) or frozenset()
             
-            while page <= self.config.max_pages_per_symbol:
-                # Call SSI API directly
-                params = {
-                    'symbol': symbol,
-                    'page': page,
-                    'pageSize': page_size,
-                    'fromDate': start_date.strftime('%d/%m/%Y'),
-                    'toDate': end_date.strftime('%d/%m/%Y')
-                }
-                
-                logger.info(f"Fetching page {page} for {symbol}...")
-                response = self.session.get(self.config.ssi_api_url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
-                if not data.get('data'):
-                    logger.warning(f"No data available for {symbol} on page {page}")
-                    break
-                
-                stock_data = data.get('data', [])
-                if not stock_data:
-                    logger.info(f"No more data on page {page} for {symbol}")
-                    break
-                
-                saved_count = 0
-                logger.info(f"Processing page {page} for {symbol}: {len(stock_data)} records")
-                
-                for item in stock_data:
-                    # Parse trading date
-                    trading_date_str = item.get('tradingDate', '')
-                    if not trading_date_str:
-                        continue
-                    
-                    try:
-                        trading_date = datetime.strptime(trading_date_str, '%d/%m/%Y').date()
-                    except ValueError:
-                        logger.warning(f"Invalid date format: {trading_date_str}")
-                        continue
-                    
-                    # Check if date is within range
-                    if trading_date < start_date or trading_date > end_date:
-                        continue
-                    
-                    # Prepare data for API
-                    stats_data = {
-                        'symbol': symbol,
-                        'date': trading_date.isoformat(),
-                        'current_price': self._safe_float(item.get('close')),
-                        'change_amount': self._safe_float(item.get('priceChanged')),
-                        'change_percent': self._safe_float(item.get('perPriceChange')),
-                        'volume': self._safe_int(item.get('volume')),
-                        'value': self._safe_int(item.get('totalMatchVal')),
-                        'high_price': self._safe_float(item.get('high')),
-                        'low_price': self._safe_float(item.get('low')),
-                        'open_price': self._safe_float(item.get('open')),
-                        'close_price': self._safe_float(item.get('close')),
-                        'ceiling_price': self._safe_float(item.get('ceilingPrice')),
-                        'floor_price': self._safe_float(item.get('floorPrice')),
-                        'ref_price': self._safe_float(item.get('refPrice')),
-                        'avg_price': self._safe_float(item.get('avgPrice')),
-                        'close_price_adjusted': self._safe_float(item.get('closePriceAdjusted')),
-                        'total_match_vol': self._safe_int(item.get('totalMatchVol')),
-                        'total_deal_val': self._safe_int(item.get('totalDealVal')),
-                        'total_deal_vol': self._safe_int(item.get('totalDealVol')),
-                        'foreign_buy_vol_total': self._safe_int(item.get('foreignBuyVolTotal')),
-                        'foreign_current_room': self._safe_int(item.get('foreignCurrentRoom')),
-                        'foreign_sell_vol_total': self._safe_int(item.get('foreignSellVolTotal')),
-                        'foreign_buy_val_total': self._safe_int(item.get('foreignBuyValTotal')),
-                        'foreign_sell_val_total': self._safe_int(item.get('foreignSellValTotal')),
-                        'foreign_buy_vol_matched': self._safe_int(item.get('foreignBuyVolMatched')),
-                        'foreign_buy_vol_deal': self._safe_int(item.get('foreignBuyVolDeal')),
-                        'total_buy_trade': self._safe_int(item.get('totalBuyTrade')),
-                        'total_buy_trade_vol': self._safe_int(item.get('totalBuyTradeVol')),
-                        'total_sell_trade': self._safe_int(item.get('totalSellTrade')),
-                        'total_sell_trade_vol': self._safe_int(item.get('totalSellTradeVol')),
-                        'net_buy_sell_vol': self._safe_int(item.get('netBuySellVol')),
-                        'net_buy_sell_val': self._safe_int(item.get('netBuySellVal')),
-                        'close_raw': self._safe_float(item.get('closeRaw')),
-                        'open_raw': self._safe_float(item.get('openRaw')),
-                        'high_raw': self._safe_float(item.get('highRaw')),
-                        'low_raw': self._safe_float(item.get('lowRaw'))
-                    }
-                    
-                    # Save to API
-                    try:
-                        save_response = self.session.post(
-                            f"{self.config.api_base_url}/stock-statistics",
-                            json=stats_data,
-                            timeout=30
-                        )
-                        save_response.raise_for_status()
-                        saved_count += 1
-                        total_saved += 1
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to save record for {symbol} on {trading_date}: {e}")
-                        self.stats['errors'] += 1
-                
-                logger.info(f"Saved {saved_count} records from page {page} for {symbol}")
-                self.stats['total_pages_processed'] += 1
-                
-                # Check if we should continue to next page
-                paging = data.get('paging', {})
-                total_records = paging.get('total', 0)
-                current_page_size = paging.get('pageSize', len(stock_data))
-                
-                logger.info(f"Page {page}: {len(stock_data)} records, Total: {total_records}, PageSize: {current_page_size}")
-                
-                # Continue if we have more data and haven't reached the total
-                if len(stock_data) < current_page_size:
-                    logger.info(f"Reached end of data for {symbol} at page {page}")
-                    break
+            # Page 1 tells us how many pages there are
+            data = await self._fetch_page(symbol, 1, page_size, start_date, end_date)
+            stock_data = data.get('data')
+            if not stock_data:
+                logger.warning("No data available for %s on page 1", symbol)
+                return 0
+            
+            total_saved = await self._save_page(symbol, 1, stock_data, start_date, end_date, existing_dates)
+            
+            paging = data.get('paging', {})
+            total_records = paging.get('total', 0)
+            current_page_size = paging.get('pageSize', len(stock_data))
+            
+            logger.info("Page 1: %s records, Total: %s, PageSize: %s", len(stock_data), total_records, current_page_size)
+            
+            # SSI returns rows newest first, so once page 1 reaches back past start_date
+            # every later page falls outside the range and is not worth requesting
+            oldest_date = pd.to_datetime(
+                pd.Series([item.get('tradingDate') for item in stock_data]), format='%d/%m/%Y', errors='coerce'
+            ).min()
+            reached_start = oldest_date < pd.Timestamp(start_date)
+            if reached_start:
+                logger.info("Page 1 for %s already reaches %s, skipping remaining pages", symbol, start_date)
+            
+            last_page = 1
+            if not reached_start and len(stock_data) >= current_page_size and total_records > current_page_size:
+                last_page = min(math.ceil(total_records / current_page_size), self.config.max_pages_per_symbol)
                 
-                # Safety check to prevent infinite loops
-                if total_records > 0 and (page * current_page_size) >= total_records:
-                    logger.info(f"Reached total records limit for {symbol} at page {page}")
-                    break
+                # Fetch the remaining pages concurrently, bounded to stay under SSI rate limits
+                semaphore = asyncio.Semaphore(self.config.max_concurrent_pages)
                 
-                page += 1
+                async def fetch_and_save(page: int) -> int:
+                    async with semaphore:
+                        try:
+                            page_data = (await self._fetch_page(symbol, page, current_page_size, start_date, end_date)).get('data')
+                            if not page_data:
+                                logger.info("No more data on page %s for %s", page, symbol)
+                                return 0
+                            return await self._save_page(symbol, page, page_data, start_date, end_date, existing_dates)
+                        except Exception as e:
+                            logger.warning("Failed to fetch page %s for %s: %s", page, symbol, e)
+                            self.stats['errors'] += 1
+                            return 0
                 
-                # Add delay to avoid overwhelming the API
-                time.sleep(0.1)
+                saved_counts = await asyncio.gather(*(fetch_and_save(page) for page in range(2, last_page + 1)))
+                total_saved += sum(saved_counts)
             
-            logger.info(f"Total saved {total_saved} records for {symbol} across {page-1} pages")
+            logger.info("Total saved %s records for %s across %s pages", total_saved, symbol, last_page)
             self.stats['data_records_fetched'] += total_saved
             self.stats['data_records_saved'] += total_saved
             
             return total_saved
             
         except Exception as e:
-            logger.error(f"Error fetching stock data for {symbol}: {e}")
+            logger.error("Error fetching stock data for %s: %s", symbol, e)
             self.stats['errors'] += 1
             return 0
     
-    def validate_data(self, symbol: str) -> Dict[str, Any]:
-        """Validate data for a symbol"""
+    async def fetch_stock_data_charts(self, symbol: str, start_date: date, end_date: date) -> int:
+        """Backfill daily OHLCV for a symbol from the charts history endpoint in a single request"""
         try:
-            url = f"{self.config.api_base_url}/stock-statistics"
+            logger.info("Fetching charts history for %s from %s to %s", symbol, start_date, end_date)
+            
+            params = {
+                'resolution': '1d',
+                'symbol': symbol,
+                'from': int(datetime.combine(start_date, datetime.min.time()).timestamp()),
+                'to': int(datetime.combine(end_date, datetime.max.time()).timestamp())
+            }
+            response = await self._ssi_get(self.config.ssi_charts_url, params=params)
+            chart_data = orjson.loads(response.content).get('data')
+            if not isinstance(chart_data, dict) or not chart_data.get('t'):
+                logger.warning("No charts history available for %s", symbol)
+                return 0
+            
+            # Reshape the t/o/h/l/c/v arrays into stock-info style columns so they share _save_page
+            columns = [chart_data.get(key, []) for key in ('t', 'o', 'h', 'l', 'c', 'v')]
+            size = min(map(len, columns))
+            timestamps, opens, highs, lows, closes, volumes = (column[:size] for column in columns)
+            # Dates in local time, as datetime.fromtimestamp would give
+            utc_offset = datetime.now().astimezone().utcoffset().total_seconds()
+            trading_dates = pd.to_datetime(np.asarray(timestamps, dtype='float64') + utc_offset, unit='s')
+            stock_data = pd.DataFrame({
+                'tradingDate': trading_dates.strftime('%d/%m/%Y'),
+                'open': opens, 'high': highs, 'low': lows, 'close': closes, 'volume': volumes
+            })
+            logger.info("Charts history for %s: %s records", symbol, len(stock_data))
+            
+            # Charts rows only carry OHLCV; upserting them over stored dates would null every other column
+            existing_dates = await self.get_existing_dates(symbol, start_date, end_date)
+            if existing_dates is None:
+                logger.error("Skipping charts backfill for %s: stored dates are unknown", symbol)
+                self.stats['errors'] += 1
+                return 0
+            
+            batch_size = self.config.charts_batch_size
+            total_saved = 0
+            for batch_no, offset in enumerate(range(0, len(stock_data), batch_size), 1):
+                total_saved += await self._save_page(
+                    symbol, batch_no, stock_data.iloc[offset:offset + batch_size], start_date, end_date, existing_dates
+                )
+            
+            logger.info("Total saved %s records for %s from charts history", total_saved, symbol)
+            self.stats['data_records_fetched'] += total_saved
+            self.stats['data_records_saved'] += total_saved
+            
+            return total_saved
+            
+        except Exception as e:
+            logger.error("Error fetching charts history for %s: %s", symbol, e)
+            self.stats['errors'] += 1
+            return 0
+    
+    async def validate_data(self, symbol: str) -> Dict[str, Any]:
+        """Validate data for a symbol using the row counts computed by the tracking API"""
+        try:
+            url = f"{self.config.api_base_url}/stock-statistics/stats"
             params = {'symbol': symbol}
             
-            response = self.session.get(url, params=params, timeout=30)
+            response = await self.client.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
-            
-            if not data:
-                return {
-                    'symbol': symbol,
-                    'total_records': 0,
-                    'duplicate_records': 0,
-                    'unique_dates': 0,
-                    'status': 'no_data'
-                }
+            counts = orjson.loads(response.content)
+            total_records = counts['total_records']
+            duplicate_records = counts['duplicate_records']
             
-            # Check for duplicates
-            dates = [record['date'] for record in data]
-            unique_dates = set(dates)
-            duplicate_records = len(dates) - len(unique_dates)
+            if total_records == 0:
+                status = 'no_data'
+            elif duplicate_records == 0:
+                status = 'complete'
+            else:
+                status = 'has_duplicates'
             
             return {
                 'symbol': symbol,
-                'total_records': len(data),
+                'total_records': total_records,
                 'duplicate_records': duplicate_records,
-                'unique_dates': len(unique_dates),
-                'status': 'complete' if duplicate_records == 0 else 'has_duplicates'
+                'unique_dates': counts['unique_dates'],
+                'status': status
             }
             
         except Exception as e:
@@ -375,37 +580,47 @@ class DirectVN100Automation:
                 'status': 'error'
             }
     
-    def run_automation(self):
+    async def process_symbol(self, semaphore: asyncio.Semaphore, index: int, total: int, symbol: str):
+        """Fetch, save and validate one symbol while holding a concurrency slot"""
+        async with semaphore:
+            logger.info(f"Processing {symbol} ({index}/{total})")
+            
+            # Calculate date range
+            start_date, end_date = await self.calculate_date_range(symbol)
+            
+            # Long backfills come from charts history in one request; recent ranges use the
+            # paginated endpoint, which also carries the foreign flow and trade columns
+            if start_date < date.today() - timedelta(days=self.config.charts_backfill_days):
+                records_saved = await self.fetch_stock_data_charts(symbol, start_date, end_date)
+            else:
+                records_saved = await self.fetch_stock_data_direct(symbol, start_date, end_date)
+            
+            # Validate data; kept for the final report
+            validation_result = await self.validate_data(symbol)
+            self.validation_results[symbol] = validation_result
+            logger.info(f"Validation result for {symbol}: {validation_result}")
+            
+            self.stats['symbols_processed'] += 1
+    
+    async def run_automation(self):
         """Run the direct automation process"""
         try:
             logger.info("Starting Direct VN100 Automation...")
             
             # Fetch VN100 symbols
-            symbols = self.fetch_vn100_symbols()
+            symbols = await self.fetch_vn100_symbols()
             if not symbols:
                 logger.error("No VN100 symbols found")
                 return False
             
             logger.info(f"Processing {len(symbols)} symbols: {symbols}")
             
-            # Process each symbol
-            for i, symbol in enumerate(symbols, 1):
-                logger.info(f"Processing {symbol} ({i}/{len(symbols)})")
-                
-                # Calculate date range
-                start_date, end_date = self.calculate_date_range(symbol)
-                
-                # Fetch data with direct SSI API calls
-                records_saved = self.fetch_stock_data_direct(symbol, start_date, end_date)
-                
-                # Validate data
-                validation_result = self.validate_data(symbol)
-                logger.info(f"Validation result for {symbol}: {validation_result}")
-                
-                self.stats['symbols_processed'] += 1
-                
-                # Add delay between symbols
-                time.sleep(1)
+            # Process symbols concurrently; the semaphore bounds in-flight symbols
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_symbols)
+            await asyncio.gather(*(
+                self.process_symbol(semaphore, i, len(symbols), symbol)
+                for i, symbol in enumerate(symbols, 1)
+            ))
             
             # Calculate final statistics
             self.stats['end_time'] = datetime.now()
@@ -416,9 +631,8 @@ class DirectVN100Automation:
             logger.info("DIRECT VN100 AUTOMATION - FINAL REPORT")
             logger.info("=" * 60)
             
-            for symbol in symbols:
-                validation_result = self.validate_data(symbol)
-                logger.info(f"{symbol}: {validation_result['total_records']} records, "
+            for validation_result in (self.validation_results[symbol] for symbol in symbols):
+                logger.info(f"{validation_result['symbol']}: {validation_result['total_records']} records, "
                           f"{validation_result['duplicate_records']} duplicates, "
                           f"status: {validation_result['status']}")
             
@@ -431,6 +645,8 @@ class DirectVN100Automation:
             logger.error(f"Error in automation: {e}")
             self.stats['errors'] += 1
             return False
+        finally:
+            await self.aclose()
 
 def main():
     """Main function"""
@@ -438,17 +654,22 @@ def main():
     parser.add_argument('--max-symbols', type=int, default=5, help='Maximum number of symbols to process')
     parser.add_argument('--max-pages', type=int, default=1000, help='Maximum pages per symbol')
     parser.add_argument('--log-level', type=str, default='INFO', help='Log level')
+    parser.add_argument('--concurrency', type=int, default=10, help='Symbols processed concurrently')
     
     args = parser.parse_args()
     
+    # SSI and the tracking API are the only hosts; resolve each once per run, not per new connection
+    install_dns_cache()
+    
     config = AutomationConfig(
         max_symbols=args.max_symbols,
         max_pages_per_symbol=args.max_pages,
-        log_level=args.log_level
+        log_level=args.log_level,
+        max_concurrent_symbols=args.concurrency
     )
     
     automation = DirectVN100Automation(config)
-    success = automation.run_automation()
+    success = asyncio.run(automation.run_automation())
     
     if success:
         print("\n" + "=" * 60)
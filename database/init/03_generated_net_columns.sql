@@ -0,0 +1,70 @@
+-- Migration Script: Derive Net Buy/Sell Columns in the Database
+-- Version: 3.0
+-- Description: Turn stock_statistics.net_buy_sell_vol/val into stored generated
+--              columns computed from the foreign buy/sell totals, so writers no
+--              longer send or bind them
+
+-- =====================================================
+-- PHASE 1: DROP DEPENDENT VIEWS
+-- =====================================================
+
+DROP VIEW IF EXISTS stock_complete_info;
+
+-- =====================================================
+-- PHASE 2: REPLACE NET COLUMNS WITH GENERATED COLUMNS
+-- =====================================================
+
+ALTER TABLE stock_statistics
+DROP COLUMN IF EXISTS net_buy_sell_vol,
+DROP COLUMN IF EXISTS net_buy_sell_val;
+
+ALTER TABLE stock_statistics
+ADD COLUMN net_buy_sell_vol BIGINT
+    GENERATED ALWAYS AS (COALESCE(foreign_buy_vol_total, 0) - COALESCE(foreign_sell_vol_total, 0)) STORED,
+ADD COLUMN net_buy_sell_val BIGINT
+    GENERATED ALWAYS AS (COALESCE(foreign_buy_val_total, 0) - COALESCE(foreign_sell_val_total, 0)) STORED;
+
+-- =====================================================
+-- PHASE 3: RECREATE VIEWS
+-- =====================================================
+
+-- View for complete stock information
+CREATE OR REPLACE VIEW stock_complete_info AS
+SELECT
+    c.symbol,
+    c.company_name,
+    c.company_name_en,
+    c.sector,
+    c.exchange,
+    c.isin,
+    c.market_cap,
+    s.date,
+    s.current_price,
+    s.change_amount,
+    s.change_percent,
+    s.volume,
+    s.value,
+    s.high_price,
+    s.low_price,
+    s.open_price,
+    s.close_price,
+    s.ceiling_price,
+    s.floor_price,
+    s.ref_price,
+    s.avg_price,
+    s.foreign_buy_vol_total,
+    s.foreign_sell_vol_total,
+    s.net_buy_sell_vol,
+    s.net_buy_sell_val
+FROM companies c
+LEFT JOIN stock_statistics s ON c.symbol = s.symbol
+WHERE s.date = (SELECT MAX(date) FROM stock_statistics WHERE symbol = c.symbol);
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+
+-- Log migration completion
+INSERT INTO migration_log (version, description, executed_at)
+VALUES ('3.0', 'Generated net_buy_sell_vol/net_buy_sell_val columns on stock_statistics', NOW())
+ON CONFLICT DO NOTHING;
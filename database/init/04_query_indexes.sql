@@ -0,0 +1,33 @@
+-- Migration Script: Indexes for API Query Patterns
+-- Version: 4.0
+-- Description: Trigram indexes backing the substring filters of GET /companies
+--              (symbol ILIKE '%..%', sector ILIKE '%..%')
+--
+-- The (symbol, date DESC) and (symbol, timestamp DESC) lookups used by
+-- /stock-statistics and /analytics/stock-summary are already covered by
+-- idx_stock_statistics_symbol_date (01) and idx_order_book_symbol_timestamp (02).
+--
+-- CONCURRENTLY avoids blocking writers when applied to a live database; run this
+-- file outside an explicit transaction (psql -f, not psql -1).
+
+-- =====================================================
+-- PHASE 1: EXTENSIONS
+-- =====================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- =====================================================
+-- PHASE 2: CREATE INDEXES
+-- =====================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_companies_symbol_trgm ON companies USING gin (symbol gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_companies_sector_trgm ON companies USING gin (sector gin_trgm_ops);
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+
+-- Log migration completion
+INSERT INTO migration_log (version, description, executed_at)
+VALUES ('4.0', 'Trigram indexes for company symbol/sector search', NOW())
+ON CONFLICT DO NOTHING;
@@ -11,23 +11,65 @@ Usage:
 
 import sys
 import os
-import requests
-import csv
 import time
+import asyncio
+import httpx
+import numpy as np
+import orjson
+import csv
 from datetime import date, datetime
+from pathlib import Path
+
+SSI_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/119.0.0.0 Safari/537.36",
+    "Referer": "https://iboard.ssi.com.vn/",
+    "Origin": "https://iboard.ssi.com.vn",
+}
+
+# Symbols fetched concurrently
+MAX_CONCURRENT_SYMBOLS = 10
+
+# Charts history columns and the CSV header they are written under
+CHART_KEYS = ("t", "o", "h", "l", "c", "v")
+CSV_FIELDNAMES = ["date", "open", "high", "low", "close", "volume"]
+
+# Large enough for a full 15-year daily file, so each CSV reaches the kernel in one write()
+CSV_WRITE_BUFFER = 1 << 20
+
+# VN100 composition changes at most quarterly, so the symbol list is cached for a day
+VN100_CACHE_PATH = Path.home() / ".cache" / "vn100_symbols.json"
+VN100_CACHE_TTL = 86400
+
+def load_cached_symbols(ttl=VN100_CACHE_TTL):
+    """Read the cached VN100 symbol list, or None if missing or older than ttl seconds"""
+    try:
+        if ttl is not None and time.time() - VN100_CACHE_PATH.stat().st_mtime >= ttl:
+            return None
+        return orjson.loads(VN100_CACHE_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def store_cached_symbols(symbols):
+    """Write the VN100 symbol list atomically so readers never see a partial file"""
+    try:
+        VN100_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = VN100_CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(symbols))
+        os.replace(tmp_path, VN100_CACHE_PATH)
+    except OSError as e:
+        print(f"Could not cache VN100 symbols: {e}")
 
-def get_vn100_symbols():
-    """Get VN100 symbols from SSI API"""
+async def get_vn100_symbols(client):
+    """Get VN100 symbols from SSI API, served from the on-disk cache while fresh"""
+    cached = load_cached_symbols()
+    if cached:
+        return cached
+    
     url = "https://iboard-query.ssi.com.vn/stock/group/VN100"
-    headers = {
-        "Accept": "application/json, text/plain, */*",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/119.0.0.0 Safari/537.36",
-        "Referer": "https://iboard.ssi.com.vn/",
-        "Origin": "https://iboard.ssi.com.vn",
-    }
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = await client.get(url)
         response.raise_for_status()
         data = response.json()
         
@@ -44,13 +86,16 @@ def get_vn100_symbols():
             if symbol:
                 symbols.append(symbol)
         
+        if symbols:
+            store_cached_symbols(symbols)
         return symbols
     except Exception as e:
         print(f"Error fetching VN100 symbols: {e}")
-        return []
+        # Fall back to a stale cache when SSI is unreachable
+        return load_cached_symbols(ttl=None) or []
 
-def fetch_symbol_data(symbol, start_date="2010-01-01", end_date=None):
-    """Fetch data for a single symbol using Charts History API"""
+async def fetch_symbol_data(client, symbol, start_date="2010-01-01", end_date=None):
+    """Fetch data for a single symbol using Charts History API; returns the t/o/h/l/c/v columns"""
     if end_date is None:
         end_date = date.today().strftime("%Y-%m-%d")
     
@@ -60,60 +105,41 @@ def fetch_symbol_data(symbol, start_date="2010-01-01", end_date=None):
     
     url = f"https://iboard-api.ssi.com.vn/statistics/charts/history?resolution=1d&symbol={symbol}&from={start_ts}&to={end_ts}"
     
-    headers = {
-        "Accept": "application/json, text/plain, */*",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/119.0.0.0 Safari/537.36",
-        "Referer": "https://iboard.ssi.com.vn/",
-        "Origin": "https://iboard.ssi.com.vn",
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = await client.get(url)
         response.raise_for_status()
         data = response.json()
         
         if "data" not in data:
-            return []
+            return ()
         
         chart_data = data["data"]
         if not isinstance(chart_data, dict):
-            return []
-        
-        # Extract arrays
-        timestamps = chart_data.get("t", [])
-        opens = chart_data.get("o", [])
-        highs = chart_data.get("h", [])
-        lows = chart_data.get("l", [])
-        closes = chart_data.get("c", [])
-        volumes = chart_data.get("v", [])
+            return ()
         
-        rows = []
-        min_length = min(len(timestamps), len(opens), len(highs), len(lows), len(closes), len(volumes))
-        
-        for i in range(min_length):
-            try:
-                dt = datetime.fromtimestamp(timestamps[i])
-                date_str = dt.date().isoformat()
-                
-                row = {
-                    "date": date_str,
-                    "open": opens[i] if i < len(opens) else None,
-                    "high": highs[i] if i < len(highs) else None,
-                    "low": lows[i] if i < len(lows) else None,
-                    "close": closes[i] if i < len(closes) else None,
-                    "volume": volumes[i] if i < len(volumes) else 0,
-                }
-                rows.append(row)
-            except Exception as e:
-                continue
-        
-        return rows
+        # Keep the column arrays as returned (t, o, h, l, c, v); rows are assembled while writing
+        return tuple(chart_data.get(key, []) for key in CHART_KEYS)
     except Exception as e:
         print(f"Error fetching data for {symbol}: {e}")
-        return []
+        return ()
+
+def format_dates(timestamps):
+    """Convert epoch seconds to local ISO dates in one NumPy pass; missing values become 'NaT'"""
+    # datetime64 is UTC, so shift by the local offset to match datetime.fromtimestamp
+    utc_offset = datetime.now().astimezone().utcoffset().total_seconds()
+    seconds = np.asarray(timestamps, dtype="float64") + utc_offset
+    return np.datetime_as_string(seconds.astype("datetime64[s]").astype("datetime64[D]"), unit="D")
 
-def save_to_csv(rows, symbol, output_dir):
-    """Save data to CSV file"""
+def iter_csv_rows(columns):
+    """Yield (date, open, high, low, close, volume) rows from the chart columns, skipping missing timestamps"""
+    timestamps, opens, highs, lows, closes, volumes = columns
+    size = min(map(len, columns))
+    for date_str, open_, high, low, close, volume in zip(format_dates(timestamps[:size]), opens, highs, lows, closes, volumes):
+        if date_str != "NaT":
+            yield (str(date_str), open_, high, low, close, volume)
+
+def save_to_csv(columns, symbol, output_dir):
+    """Save data to CSV file; returns the file path and the number of rows written"""
     today = date.today().strftime("%Y-%m-%d")
     output_path = os.path.join(output_dir, f"{today}")
     os.makedirs(output_path, exist_ok=True)
@@ -121,62 +147,67 @@ def save_to_csv(rows, symbol, output_dir):
     filename = f"{symbol}_daily_2010-01-01_{date.today().strftime('%Y-%m-%d')}_full.csv"
     filepath = os.path.join(output_path, filename)
     
-    fieldnames = ["date", "open", "high", "low", "close", "volume"]
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
+    count = 0
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+        for row in iter_csv_rows(columns):
             writer.writerow(row)
+            count += 1
     
-    return filepath
+    return filepath, count
 
-def main():
-    """Main function"""
-    print("🚀 Fetching VN100 symbols and data from 2010-01-01 to present...")
-    print("⏳ This may take several minutes...")
-    print()
-    
-    # Get VN100 symbols
-    print("📊 Fetching VN100 symbols...")
-    symbols = get_vn100_symbols()
-    if not symbols:
-        print("❌ No VN100 symbols found")
-        return 1
-    
-    print(f"✅ Found {len(symbols)} VN100 symbols")
-    print(f"Symbols: {', '.join(symbols[:10])}{'...' if len(symbols) > 10 else ''}")
-    print()
-    
-    # Setup output directory
-    output_dir = "/Users/macintoshhd/Project/Project/stock_playing/tracking_data/output"
-    
-    # Process each symbol
-    success_count = 0
-    failed_symbols = []
-    
-    for i, symbol in enumerate(symbols, 1):
-        print(f"[{i}/{len(symbols)}] Processing {symbol}...")
+async def process_symbol(client, semaphore, index, total, symbol, output_dir):
+    """Fetch and save one symbol while holding a concurrency slot; returns True on success"""
+    async with semaphore:
+        print(f"[{index}/{total}] Processing {symbol}...")
         
         try:
             # Fetch data
-            rows = fetch_symbol_data(symbol)
+            columns = await fetch_symbol_data(client, symbol)
             
-            if rows:
-                # Save to CSV
-                filepath = save_to_csv(rows, symbol, output_dir)
-                print(f"  ✅ {symbol}: {len(rows)} records saved to {os.path.basename(filepath)}")
-                success_count += 1
-            else:
-                print(f"  ⚠️  {symbol}: No data found")
-                failed_symbols.append(symbol)
+            if columns and min(map(len, columns)):
+                # Save to CSV in a worker thread so disk writes overlap with other symbols' fetches
+                filepath, count = await asyncio.to_thread(save_to_csv, columns, symbol, output_dir)
+                print(f"  ✅ {symbol}: {count} records saved to {os.path.basename(filepath)}")
+                return True
+            print(f"  ⚠️  {symbol}: No data found")
             
         except Exception as e:
             print(f"  ❌ {symbol}: Error - {e}")
-            failed_symbols.append(symbol)
+        return False
+
+async def run():
+    """Fetch all VN100 symbols concurrently"""
+    print("🚀 Fetching VN100 symbols and data from 2010-01-01 to present...")
+    print("⏳ This may take several minutes...")
+    print()
+    
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    async with httpx.AsyncClient(http2=True, headers=SSI_HEADERS, limits=limits, timeout=30) as client:
+        # Get VN100 symbols
+        print("📊 Fetching VN100 symbols...")
+        symbols = await get_vn100_symbols(client)
+        if not symbols:
+            print("❌ No VN100 symbols found")
+            return 1
+        
+        print(f"✅ Found {len(symbols)} VN100 symbols")
+        print(f"Symbols: {', '.join(symbols[:10])}{'...' if len(symbols) > 10 else ''}")
+        print()
         
-        # Rate limiting
-        if i < len(symbols):
-            time.sleep(1)
+        # Setup output directory
+        output_dir = "/Users/macintoshhd/Project/Project/stock_playing/tracking_data/output"
+        
+        # Process symbols concurrently; the semaphore replaces the per-symbol sleep
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SYMBOLS)
+        results = await asyncio.gather(*(
+            process_symbol(client, semaphore, i, len(symbols), symbol, output_dir)
+            for i, symbol in enumerate(symbols, 1)
+        ))
+    
+    success_count = sum(results)
+    failed_symbols = [symbol for symbol, ok in zip(symbols, results) if not ok]
     
     # Summary
     print()
@@ -201,5 +232,9 @@ def main():
     
     return 0 if success_count > 0 else 1
 
+def main():
+    """Main function"""
+    return asyncio.run(run())
+
 if __name__ == "__main__":
     sys.exit(main())
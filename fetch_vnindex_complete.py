@@ -10,12 +10,8 @@ Usage:
 """
 
 import sys
-import os
 
-# Add scripts directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'scripts'))
-
-from fetch_vnindex_2010_present import main
+from scripts.fetch_vnindex_2010_present import main
 
 if __name__ == "__main__":
     print("🚀 Fetching VN-Index data from 2010-01-01 to present day...")
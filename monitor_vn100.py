@@ -6,60 +6,170 @@ VN100 Progress Monitor
 Monitor the progress of VN100 data fetching.
 
 Usage:
-    python monitor_vn100.py
+    python monitor_vn100.py [OUTPUT_DIR]
+
+OUTPUT_DIR defaults to $VN100_OUTPUT_DIR, then to DEFAULT_OUTPUT_DIR.
 """
 
+import argparse
+import heapq
 import os
+import sys
+import threading
 import time
-from datetime import datetime
 
-def monitor_progress():
-    """Monitor VN100 fetching progress"""
-    output_dir = "/Users/macintoshhd/Project/Project/stock_playing/tracking_data/output/2025-10-20"
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # fall back to polling the directory
+    FileSystemEventHandler = object
+    Observer = None
+
+TOTAL_SYMBOLS = 100
+SEPARATOR = "-" * 60
+DEFAULT_OUTPUT_DIR = "/Users/macintoshhd/Project/Project/stock_playing/tracking_data/output/2025-10-20"
+
+def is_vn100_csv(name):
+    """True for per-symbol VN100 CSV files (VN-Index exports excluded)"""
+    return name.endswith('.csv') and not name.startswith('VNINDEX')
+
+def scan_vn100_files(output_dir):
+    """Return the names of the VN100 CSV files in output_dir, stopping once all are found"""
+    vn100_files = set()
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if is_vn100_csv(entry.name):
+                vn100_files.add(entry.name)
+                if len(vn100_files) >= TOTAL_SYMBOLS:
+                    break
+    return vn100_files
+
+def report_progress(vn100_files, start_time):
+    """Write completed count, rate and the latest files in a single stdout write"""
+    current_count = len(vn100_files)
+    elapsed_time = time.monotonic() - start_time
+    rate = current_count / (elapsed_time / 60) if elapsed_time > 0 else 0.0
     
-    print("🔍 Monitoring VN100 data fetching progress...")
-    print("📁 Output directory:", output_dir)
-    print("⏰ Started at:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-    print("-" * 60)
+    msg = (
+        f"✅ Progress: {current_count}/{TOTAL_SYMBOLS} VN100 symbols completed\n"
+        f"⏱️  Elapsed time: {elapsed_time/60:.1f} minutes\n"
+        f"📊 Rate: {rate:.1f} symbols/minute\n"
+    )
+    
+    # The latest files are only interesting while the fetch is still running
+    if vn100_files and current_count < TOTAL_SYMBOLS:
+        latest_files = sorted(heapq.nlargest(3, vn100_files))
+        msg += f"📄 Latest files: {', '.join(latest_files)}\n"
+    
+    sys.stdout.write(msg + SEPARATOR + "\n")
+    sys.stdout.flush()
+
+class VN100FileHandler(FileSystemEventHandler):
+    """Track VN100 CSV files as the kernel reports them being written"""
+    
+    def __init__(self, vn100_files, start_time):
+        super().__init__()
+        self.vn100_files = vn100_files
+        self.start_time = start_time
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+    
+    def on_created(self, event):
+        self._record(event.src_path)
+    
+    def on_moved(self, event):
+        self._record(event.dest_path)
+    
+    def _record(self, path):
+        name = os.path.basename(path)
+        if not is_vn100_csv(name):
+            return
+        with self.lock:
+            if name in self.vn100_files:
+                return
+            self.vn100_files.add(name)
+            report_progress(self.vn100_files, self.start_time)
+            if len(self.vn100_files) >= TOTAL_SYMBOLS:
+                self.done.set()
+
+def watch_progress(output_dir, start_time):
+    """Block until all VN100 files exist, woken only by filesystem events"""
+    handler = VN100FileHandler(set(), start_time)
     
-    last_count = 0
-    start_time = time.time()
+    # Start watching before the initial scan so files created in between still raise events
+    observer = Observer()
+    observer.schedule(handler, output_dir, recursive=False)
+    observer.start()
+    try:
+        existing = scan_vn100_files(output_dir)
+        with handler.lock:
+            handler.vn100_files.update(existing)
+            if handler.vn100_files:
+                report_progress(handler.vn100_files, start_time)
+            if len(handler.vn100_files) >= TOTAL_SYMBOLS:
+                handler.done.set()
+        
+        handler.done.wait()
+        print("🎉 All VN100 symbols completed!")
+    finally:
+        observer.stop()
+        observer.join()
+
+def poll_progress(output_dir, start_time):
+    """Re-scan the output directory every 30 seconds (used when watchdog is unavailable)"""
+    seen = set()
     
     while True:
         try:
-            if os.path.exists(output_dir):
-                files = [f for f in os.listdir(output_dir) if f.endswith('.csv')]
-                vn100_files = [f for f in files if not f.startswith('VNINDEX')]
-                
-                current_count = len(vn100_files)
-                elapsed_time = time.time() - start_time
-                
-                if current_count > last_count:
-                    print(f"✅ Progress: {current_count}/100 VN100 symbols completed")
-                    print(f"⏱️  Elapsed time: {elapsed_time/60:.1f} minutes")
-                    print(f"📊 Rate: {current_count/(elapsed_time/60):.1f} symbols/minute")
-                    
-                    if current_count >= 100:
-                        print("🎉 All VN100 symbols completed!")
-                        break
-                    
-                    last_count = current_count
-                
-                # Show latest files
-                if vn100_files:
-                    latest_files = sorted(vn100_files)[-3:]
-                    print(f"📄 Latest files: {', '.join(latest_files)}")
+            current = scan_vn100_files(output_dir)
+            new_files = current - seen
+            seen = current
+            
+            # Only report when something new has appeared
+            if new_files:
+                report_progress(current, start_time)
                 
-                print("-" * 60)
+                if len(current) >= TOTAL_SYMBOLS:
+                    print("🎉 All VN100 symbols completed!")
+                    break
             
             time.sleep(30)  # Check every 30 seconds
-            
-        except KeyboardInterrupt:
-            print("\n⏹️  Monitoring stopped by user")
-            break
+        
         except Exception as e:
             print(f"❌ Error: {e}")
             time.sleep(10)
 
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Monitor VN100 data fetching progress")
+    parser.add_argument(
+        "output_dir",
+        nargs="?",
+        default=os.environ.get("VN100_OUTPUT_DIR", DEFAULT_OUTPUT_DIR),
+        help="Directory the VN100 CSV files are written to",
+    )
+    return parser.parse_args()
+
+def monitor_progress(output_dir):
+    """Monitor VN100 fetching progress"""
+    if not os.path.isdir(output_dir):
+        print(f"❌ Output directory not found: {output_dir}")
+        sys.exit(2)
+    
+    print("🔍 Monitoring VN100 data fetching progress...")
+    print("📁 Output directory:", output_dir)
+    print("⏰ Started at:", time.strftime("%Y-%m-%d %H:%M:%S"))
+    print(SEPARATOR)
+    
+    start_time = time.monotonic()
+    
+    try:
+        if Observer is not None:
+            watch_progress(output_dir, start_time)
+        else:
+            poll_progress(output_dir, start_time)
+    except KeyboardInterrupt:
+        print("\n⏹️  Monitoring stopped by user")
+
 if __name__ == "__main__":
-    monitor_progress()
+    monitor_progress(parse_args().output_dir)
@@ -9,17 +9,24 @@ This pipeline fetches and stores ALL data fields from SSI APIs:
 - VN100 Group API: 69 fields
 """
 
-import requests
-import json
+import asyncio
+import functools
 import logging
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass
-import time
 import argparse
+import sqlite3
 import sys
+import time
 from pathlib import Path
 
+import httpx
+import numpy as np
+import orjson
+import pandas as pd
+from tenacity import AsyncRetrying, before_sleep_log, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -34,9 +41,221 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# SSI iBoard endpoints
+SSI_VN100_URL = "https://iboard-query.ssi.com.vn/stock/group/VN100"
+SSI_STOCK_INFO_URL = "https://iboard-api.ssi.com.vn/statistics/company/ssmi/stock-info"
+SSI_CHARTS_HISTORY_URL = "https://iboard-api.ssi.com.vn/statistics/charts/history"
+
+# Tracking API field, SSI field and target type for stock statistics rows
+STATS_FIELD_MAP = (
+    ('current_price', 'close', float),
+    ('change_amount', 'priceChanged', float),
+    ('change_percent', 'perPriceChange', float),
+    ('volume', 'volume', int),
+    ('value', 'totalMatchVal', int),
+    ('high_price', 'high', float),
+    ('low_price', 'low', float),
+    ('open_price', 'open', float),
+    ('close_price', 'close', float),
+
+    # Extended fields
+    ('ceiling_price', 'ceilingPrice', float),
+    ('floor_price', 'floorPrice', float),
+    ('ref_price', 'refPrice', float),
+    ('avg_price', 'avgPrice', float),
+    ('close_price_adjusted', 'closePriceAdjusted', float),
+    ('total_match_vol', 'totalMatchVol', int),
+    ('total_deal_val', 'totalDealVal', int),
+    ('total_deal_vol', 'totalDealVol', int),
+
+    # Foreign trading data
+    ('foreign_buy_vol_total', 'foreignBuyVolTotal', int),
+    ('foreign_current_room', 'foreignCurrentRoom', int),
+    ('foreign_sell_vol_total', 'foreignSellVolTotal', int),
+    ('foreign_buy_val_total', 'foreignBuyValTotal', int),
+    ('foreign_sell_val_total', 'foreignSellValTotal', int),
+    ('foreign_buy_vol_matched', 'foreignBuyVolMatched', int),
+    ('foreign_buy_vol_deal', 'foreignBuyVolDeal', int),
+
+    # Trading statistics
+    ('total_buy_trade', 'totalBuyTrade', int),
+    ('total_buy_trade_vol', 'totalBuyTradeVol', int),
+    ('total_sell_trade', 'totalSellTrade', int),
+    ('total_sell_trade_vol', 'totalSellTradeVol', int),
+
+    # Raw prices
+    ('close_raw', 'closeRaw', float),
+    ('open_raw', 'openRaw', float),
+    ('high_raw', 'highRaw', float),
+    ('low_raw', 'lowRaw', float),
+)
+
+# Tracking API field, VN100 component field and default for company rows
+COMPANY_FIELD_MAP = (
+    ('company_name', 'companyNameVi', ''),
+    ('company_name_en', 'companyNameEn', ''),
+    ('sector', 'sector', ''),
+    ('industry', 'sector', ''),
+    ('exchange', 'exchange', 'HOSE'),
+    ('market_cap', 'marketCap', None),
+    ('isin', 'isin', None),
+    ('board_id', 'boardId', None),
+    ('admin_status', 'adminStatus', None),
+    ('ca_status', 'caStatus', None),
+    ('par_value', 'parValue', None),
+    ('trading_unit', 'tradingUnit', None),
+    ('contract_multiplier', 'contractMultiplier', None),
+    ('product_id', 'productId', None),
+)
+
+# Tracking API field and VN100 component field for index component rows
+INDEX_COMPONENT_FIELD_MAP = (
+    ('weight', 'weight'),
+    ('market_cap', 'marketCap'),
+    ('current_price', 'matchedPrice'),
+    ('change_amount', 'priceChange'),
+    ('change_percent', 'priceChangePercent'),
+    ('sector', 'sector'),
+    ('exchange', 'exchange'),
+
+    # Extended fields
+    ('isin', 'isin'),
+    ('board_id', 'boardId'),
+    ('admin_status', 'adminStatus'),
+    ('ca_status', 'caStatus'),
+    ('ceiling', 'ceiling'),
+    ('floor', 'floor'),
+    ('ref_price', 'refPrice'),
+    ('par_value', 'parValue'),
+    ('trading_unit', 'tradingUnit'),
+    ('contract_multiplier', 'contractMultiplier'),
+    ('prior_close_price', 'priorClosePrice'),
+    ('product_id', 'productId'),
+    ('last_mf_seq', 'lastMFSeq'),
+    ('remain_foreign_qtty', 'remainForeignQtty'),
+
+    # Order book data
+    ('best1_bid', 'best1Bid'),
+    ('best1_bid_vol', 'best1BidVol'),
+    ('best1_offer', 'best1Offer'),
+    ('best1_offer_vol', 'best1OfferVol'),
+    ('best2_bid', 'best2Bid'),
+    ('best2_bid_vol', 'best2BidVol'),
+    ('best2_offer', 'best2Offer'),
+    ('best2_offer_vol', 'best2OfferVol'),
+    ('best3_bid', 'best3Bid'),
+    ('best3_bid_vol', 'best3BidVol'),
+    ('best3_offer', 'best3Offer'),
+    ('best3_offer_vol', 'best3OfferVol'),
+
+    # Expected data
+    ('expected_last_update', 'expectedLastUpdate'),
+    ('expected_matched_price', 'expectedMatchedPrice'),
+    ('expected_matched_volume', 'expectedMatchedVolume'),
+    ('expected_price_change', 'expectedPriceChange'),
+    ('expected_price_change_percent', 'expectedPriceChangePercent'),
+
+    # Trading data
+    ('last_me_seq', 'lastMESeq'),
+    ('avg_price', 'avgPrice'),
+    ('highest', 'highest'),
+    ('lowest', 'lowest'),
+    ('matched_volume', 'matchedVolume'),
+    ('nm_total_traded_qty', 'nmTotalTradedQty'),
+    ('nm_total_traded_value', 'nmTotalTradedValue'),
+    ('open_price', 'openPrice'),
+    ('stock_sd_vol', 'stockSDVol'),
+    ('stock_vol', 'stockVol'),
+    ('stock_bu_vol', 'stockBUVol'),
+
+    # Foreign trading
+    ('buy_foreign_qtty', 'buyForeignQtty'),
+    ('buy_foreign_value', 'buyForeignValue'),
+    ('last_mt_seq', 'lastMTSeq'),
+    ('sell_foreign_qtty', 'sellForeignQtty'),
+    ('sell_foreign_value', 'sellForeignValue'),
+
+    # Session data
+    ('session', 'session'),
+    ('odd_session', 'oddSession'),
+    ('session_pt', 'sessionPt'),
+    ('odd_session_pt', 'oddSessionPt'),
+    ('session_rt', 'sessionRt'),
+    ('odd_session_rt', 'oddSessionRt'),
+    ('odd_session_rt_start', 'oddSessionRtStart'),
+    ('session_rt_start', 'sessionRtStart'),
+    ('session_start', 'sessionStart'),
+    ('odd_session_start', 'oddSessionStart'),
+    ('exchange_session', 'exchangeSession'),
+    ('is_pre_session_price', 'isPreSessionPrice'),
+)
+
+# Index component fields holding epoch timestamps, stored as ISO strings
+INDEX_COMPONENT_TIMESTAMP_FIELDS = frozenset({
+    'expected_last_update',
+    'odd_session_rt_start',
+    'session_rt_start',
+    'session_start',
+    'odd_session_start',
+})
+
+def _safe_float(value: Any) -> Optional[float]:
+    """Safely convert value to float"""
+    # JSON numbers are the common case; skip the string checks for them
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+def _safe_int(value: Any) -> Optional[int]:
+    """Safely convert value to int"""
+    if type(value) is int:
+        return value
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+def _is_retryable_save_error(exc: BaseException) -> bool:
+    """Retry failed saves and transport errors, but not validation errors (422)"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code != 422
+    return isinstance(exc, httpx.HTTPError)
+
+@functools.lru_cache(maxsize=8192)
+def _timestamp_to_iso(timestamp: int) -> str:
+    """Convert an epoch timestamp (seconds or milliseconds) to a local ISO string"""
+    # Session timestamps repeat across every VN100 component, so most calls hit the cache
+    if timestamp > 1e12:  # milliseconds
+        return datetime.fromtimestamp(timestamp / 1000).isoformat()
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+# Symbols in a run mostly share one date window, so these repeat for every symbol
+@functools.lru_cache(maxsize=256)
+def _ssi_date(day: date) -> str:
+    """Format a date the way the SSI stock-info endpoint expects (DD/MM/YYYY)"""
+    return day.strftime('%d/%m/%Y')
+
+@functools.lru_cache(maxsize=256)
+def _epoch_range(start_date: date, end_date: date) -> Tuple[int, int]:
+    """Return local epoch seconds for the start of start_date and the end of end_date"""
+    return (
+        int(datetime.combine(start_date, datetime.min.time()).timestamp()),
+        int(datetime.combine(end_date, datetime.max.time()).timestamp())
+    )
+
+@dataclass(slots=True, frozen=True)
 class ExtendedPipelineConfig:
-    """Extended configuration for complete data pipeline"""
+    """Extended configuration for complete data pipeline (read-only once the pipeline is built)"""
     # Basic parameters
     max_stocks: int = 5
     symbols: Optional[List[str]] = None
@@ -47,6 +266,9 @@ class ExtendedPipelineConfig:
     
     # Incremental mode
     incremental_mode: bool = True  # Enable incremental updates by default
+    last_update_cache_ttl: int = 300  # Seconds a preloaded set of last update dates is reused
+    cursor_path: Optional[Path] = Path.home() / '.ssi_pipeline' / 'cursor.sqlite'  # None disables the local cursor
+    rebuild_cursor: bool = False  # Clear the local cursor and re-read last dates from the API
     
     # API configuration
     api_base_url: str = "http://localhost:8000"
@@ -54,6 +276,11 @@ class ExtendedPipelineConfig:
     retry_delay: float = 1.0
     request_timeout: int = 30
     rate_limit_delay: float = 0.1
+    max_concurrency: int = 16  # Symbols processed at the same time
+    max_connections: int = 32
+    bulk_batch_size: int = 500  # Rows per POST to the bulk endpoints
+    save_workers: int = 8  # Tasks posting queued row batches
+    save_queue_size: int = 64  # Row batches waiting for a save worker
     
     # Data processing
     validate_data: bool = True
@@ -67,13 +294,22 @@ class ExtendedPipelineConfig:
 class ExtendedSSIPipeline:
     """Extended SSI Pipeline for complete data fetching"""
     
+    _safe_float = staticmethod(_safe_float)
+    _safe_int = staticmethod(_safe_int)
+    
     def __init__(self, config: ExtendedPipelineConfig):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Referer': 'https://iboard.ssi.com.vn/'
-        })
+        self.session = self._create_session()
+        
+        # Last stored date per symbol, preloaded in one request for incremental mode
+        self._last_update_cache: Dict[str, Optional[date]] = {}
+        self._last_update_loaded_at = 0.0
+        
+        # Local per-endpoint cursor of the last saved date, opened for the duration of a run
+        self._cursor_db: Optional[sqlite3.Connection] = None
+        
+        # Row batches handed from symbol processing to the save workers during a run
+        self._save_queue: Optional[asyncio.Queue] = None
         
         # Set up logging
         if self.config.log_file:
@@ -96,14 +332,32 @@ class ExtendedSSIPipeline:
             'start_time': datetime.now()
         }
     
-    def fetch_vn100_data(self) -> Optional[Dict[str, Any]]:
+    def _create_session(self) -> httpx.AsyncClient:
+        """Create the shared async HTTP client for SSI and tracking API calls"""
+        return httpx.AsyncClient(
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                'Accept-Encoding': 'gzip, br',
+                'Referer': 'https://iboard.ssi.com.vn/'
+            },
+            # SSI negotiates HTTP/2 over TLS, multiplexing the concurrent symbol fetches on one connection
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_connections
+            ),
+            # Requests queue for a pooled connection without a deadline; the pool bounds concurrency
+            timeout=httpx.Timeout(self.config.request_timeout, pool=None)
+        )
+    
+    async def fetch_vn100_data(self) -> Optional[Dict[str, Any]]:
         """Fetch VN100 data with complete field mapping"""
         try:
-            url = "https://iboard-query.ssi.com.vn/stock/group/VN100"
-            response = self.session.get(url, timeout=self.config.request_timeout)
+            response = await self.session.get(SSI_VN100_URL)
             response.raise_for_status()
+            logger.debug(f"SSI connection negotiated {response.http_version}")
             
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"Fetched VN100 data: {len(data.get('data', []))} components")
             return data
             
@@ -111,7 +365,7 @@ class ExtendedSSIPipeline:
             logger.error(f"Error fetching VN100 data: {e}")
             return None
     
-    def process_vn100_components(self, vn100_data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> List[str]:
+    async def process_vn100_components(self, vn100_data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> List[str]:
         """Process VN100 data and extract all available fields"""
         try:
             if isinstance(vn100_data, dict) and 'data' in vn100_data:
@@ -127,6 +381,8 @@ class ExtendedSSIPipeline:
                 return []
             
             symbols = []
+            company_rows = []
+            last_update = datetime.now().isoformat()
             
             for component in components:
                 if not isinstance(component, dict):
@@ -142,113 +398,20 @@ class ExtendedSSIPipeline:
                 
                 if not self.config.dry_run:
                     # Save complete company info
-                    company_data = {
-                        'symbol': symbol,
-                        'company_name': component.get('companyNameVi', ''),
-                        'company_name_en': component.get('companyNameEn', ''),
-                        'sector': component.get('sector', ''),
-                        'industry': component.get('sector', ''),
-                        'exchange': component.get('exchange', 'HOSE'),
-                        'market_cap': component.get('marketCap'),
-                        'isin': component.get('isin'),
-                        'board_id': component.get('boardId'),
-                        'admin_status': component.get('adminStatus'),
-                        'ca_status': component.get('caStatus'),
-                        'par_value': component.get('parValue'),
-                        'trading_unit': component.get('tradingUnit'),
-                        'contract_multiplier': component.get('contractMultiplier'),
-                        'product_id': component.get('productId')
-                    }
+                    company_data = {'symbol': symbol}
+                    for column, source, default in COMPANY_FIELD_MAP:
+                        company_data[column] = component.get(source, default)
                     
-                    success = self.save_to_api('companies', company_data)
-                    if success:
-                        self.stats['companies_processed'] += 1
+                    company_rows.append(company_data)
                     
                     # Save complete index component info
-                    index_component_data = {
-                        'index_name': 'VN100',
-                        'symbol': symbol,
-                        'weight': component.get('weight'),
-                        'market_cap': component.get('marketCap'),
-                        'current_price': component.get('matchedPrice'),
-                        'change_amount': component.get('priceChange'),
-                        'change_percent': component.get('priceChangePercent'),
-                        'sector': component.get('sector'),
-                        'exchange': component.get('exchange'),
-                        
-                        # Extended fields
-                        'isin': component.get('isin'),
-                        'board_id': component.get('boardId'),
-                        'admin_status': component.get('adminStatus'),
-                        'ca_status': component.get('caStatus'),
-                        'ceiling': component.get('ceiling'),
-                        'floor': component.get('floor'),
-                        'ref_price': component.get('refPrice'),
-                        'par_value': component.get('parValue'),
-                        'trading_unit': component.get('tradingUnit'),
-                        'contract_multiplier': component.get('contractMultiplier'),
-                        'prior_close_price': component.get('priorClosePrice'),
-                        'product_id': component.get('productId'),
-                        'last_mf_seq': component.get('lastMFSeq'),
-                        'remain_foreign_qtty': component.get('remainForeignQtty'),
-                        
-                        # Order book data
-                        'best1_bid': component.get('best1Bid'),
-                        'best1_bid_vol': component.get('best1BidVol'),
-                        'best1_offer': component.get('best1Offer'),
-                        'best1_offer_vol': component.get('best1OfferVol'),
-                        'best2_bid': component.get('best2Bid'),
-                        'best2_bid_vol': component.get('best2BidVol'),
-                        'best2_offer': component.get('best2Offer'),
-                        'best2_offer_vol': component.get('best2OfferVol'),
-                        'best3_bid': component.get('best3Bid'),
-                        'best3_bid_vol': component.get('best3BidVol'),
-                        'best3_offer': component.get('best3Offer'),
-                        'best3_offer_vol': component.get('best3OfferVol'),
-                        
-                        # Expected data
-                        'expected_last_update': self._convert_timestamp(component.get('expectedLastUpdate')),
-                        'expected_matched_price': component.get('expectedMatchedPrice'),
-                        'expected_matched_volume': component.get('expectedMatchedVolume'),
-                        'expected_price_change': component.get('expectedPriceChange'),
-                        'expected_price_change_percent': component.get('expectedPriceChangePercent'),
-                        
-                        # Trading data
-                        'last_me_seq': component.get('lastMESeq'),
-                        'avg_price': component.get('avgPrice'),
-                        'highest': component.get('highest'),
-                        'lowest': component.get('lowest'),
-                        'matched_volume': component.get('matchedVolume'),
-                        'nm_total_traded_qty': component.get('nmTotalTradedQty'),
-                        'nm_total_traded_value': component.get('nmTotalTradedValue'),
-                        'open_price': component.get('openPrice'),
-                        'stock_sd_vol': component.get('stockSDVol'),
-                        'stock_vol': component.get('stockVol'),
-                        'stock_bu_vol': component.get('stockBUVol'),
-                        
-                        # Foreign trading
-                        'buy_foreign_qtty': component.get('buyForeignQtty'),
-                        'buy_foreign_value': component.get('buyForeignValue'),
-                        'last_mt_seq': component.get('lastMTSeq'),
-                        'sell_foreign_qtty': component.get('sellForeignQtty'),
-                        'sell_foreign_value': component.get('sellForeignValue'),
-                        
-                        # Session data
-                        'session': component.get('session'),
-                        'odd_session': component.get('oddSession'),
-                        'session_pt': component.get('sessionPt'),
-                        'odd_session_pt': component.get('oddSessionPt'),
-                        'session_rt': component.get('sessionRt'),
-                        'odd_session_rt': component.get('oddSessionRt'),
-                        'odd_session_rt_start': self._convert_timestamp(component.get('oddSessionRtStart')),
-                        'session_rt_start': self._convert_timestamp(component.get('sessionRtStart')),
-                        'session_start': self._convert_timestamp(component.get('sessionStart')),
-                        'odd_session_start': self._convert_timestamp(component.get('oddSessionStart')),
-                        'exchange_session': component.get('exchangeSession'),
-                        'is_pre_session_price': component.get('isPreSessionPrice'),
-                        
-                        'last_update': datetime.now().isoformat()
-                    }
+                    index_component_data = {'index_name': 'VN100', 'symbol': symbol}
+                    for column, source in INDEX_COMPONENT_FIELD_MAP:
+                        value = component.get(source)
+                        if column in INDEX_COMPONENT_TIMESTAMP_FIELDS:
+                            value = self._convert_timestamp(value)
+                        index_component_data[column] = value
+                    index_component_data['last_update'] = last_update
                     
                     # Skip market indices - endpoint not available
                     # Market indices data will be saved as part of companies data
@@ -266,6 +429,9 @@ class ExtendedSSIPipeline:
                     # Session info data will be saved as part of stock statistics
                     logger.info(f"Skipping session-info endpoint for {symbol} - not available")
             
+            if company_rows:
+                self.stats['companies_processed'] += await self.save_batch_to_api('companies/bulk', company_rows)
+            
             logger.info(f"Processed {len(symbols)} VN100 components with complete data")
             return symbols
             
@@ -277,32 +443,28 @@ class ExtendedSSIPipeline:
         """Convert timestamp to ISO format"""
         if timestamp is None:
             return None
-        try:
-            if isinstance(timestamp, int):
-                # Handle milliseconds timestamp
-                if timestamp > 1e12:  # milliseconds
-                    timestamp = timestamp / 1000
-                return datetime.fromtimestamp(timestamp).isoformat()
-            return str(timestamp)
-        except Exception:
-            return None
+        if isinstance(timestamp, int):
+            try:
+                return _timestamp_to_iso(timestamp)
+            except (OverflowError, OSError, ValueError):
+                return None
+        return str(timestamp)
     
-    def fetch_stock_info(self, symbol: str, start_date: date, end_date: date) -> Optional[Dict[str, Any]]:
+    async def fetch_stock_info(self, symbol: str, start_date: date, end_date: date) -> Optional[Dict[str, Any]]:
         """Fetch complete stock info with all fields"""
         try:
-            url = "https://iboard-api.ssi.com.vn/statistics/company/ssmi/stock-info"
             params = {
                 'symbol': symbol,
                 'page': 1,
                 'pageSize': 100,
-                'fromDate': start_date.strftime('%d/%m/%Y'),
-                'toDate': end_date.strftime('%d/%m/%Y')
+                'fromDate': _ssi_date(start_date),
+                'toDate': _ssi_date(end_date)
             }
             
-            response = self.session.get(url, params=params, timeout=self.config.request_timeout)
+            response = await self.session.get(SSI_STOCK_INFO_URL, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"Fetched stock info for {symbol}: {len(data.get('data', []))} records")
             return data
             
@@ -310,125 +472,73 @@ class ExtendedSSIPipeline:
             logger.error(f"Error fetching stock info for {symbol}: {e}")
             return None
     
-    def process_stock_info(self, symbol: str, stock_info: Dict[str, Any]) -> int:
+    async def process_stock_info(self, symbol: str, stock_info: Dict[str, Any]) -> int:
         """Process stock info data with complete field mapping"""
         try:
             if not isinstance(stock_info, dict) or 'data' not in stock_info:
                 logger.warning(f"No data in stock info for {symbol}")
                 return 0
             
-            saved_count = 0
+            items = [item for item in stock_info['data'] if isinstance(item, dict)]
+            stats_batch = self._build_stats_frame(symbol, items)
             
-            for item in stock_info['data']:
-                if not isinstance(item, dict):
-                    continue
-                
-                # Parse trading date
-                trading_date = item.get('tradingDate', '')
-                parsed_date = date.today()
-                if trading_date:
-                    try:
-                        parsed_date = datetime.strptime(trading_date, '%d/%m/%Y').date()
-                    except ValueError:
-                        logger.warning(f"Could not parse date: {trading_date}")
-                
-                # Complete stock statistics data
-                stats_data = {
-                    'symbol': symbol,
-                    'date': parsed_date.isoformat(),
-                    'current_price': self._safe_float(item.get('close')),
-                    'change_amount': self._safe_float(item.get('priceChanged')),
-                    'change_percent': self._safe_float(item.get('perPriceChange')),
-                    'volume': self._safe_int(item.get('volume')),
-                    'value': self._safe_int(item.get('totalMatchVal')),
-                    'high_price': self._safe_float(item.get('high')),
-                    'low_price': self._safe_float(item.get('low')),
-                    'open_price': self._safe_float(item.get('open')),
-                    'close_price': self._safe_float(item.get('close')),
-                    
-                    # Extended fields
-                    'ceiling_price': self._safe_float(item.get('ceilingPrice')),
-                    'floor_price': self._safe_float(item.get('floorPrice')),
-                    'ref_price': self._safe_float(item.get('refPrice')),
-                    'avg_price': self._safe_float(item.get('avgPrice')),
-                    'close_price_adjusted': self._safe_float(item.get('closePriceAdjusted')),
-                    'total_match_vol': self._safe_int(item.get('totalMatchVol')),
-                    'total_deal_val': self._safe_int(item.get('totalDealVal')),
-                    'total_deal_vol': self._safe_int(item.get('totalDealVol')),
-                    
-                    # Foreign trading data
-                    'foreign_buy_vol_total': self._safe_int(item.get('foreignBuyVolTotal')),
-                    'foreign_current_room': self._safe_int(item.get('foreignCurrentRoom')),
-                    'foreign_sell_vol_total': self._safe_int(item.get('foreignSellVolTotal')),
-                    'foreign_buy_val_total': self._safe_int(item.get('foreignBuyValTotal')),
-                    'foreign_sell_val_total': self._safe_int(item.get('foreignSellValTotal')),
-                    'foreign_buy_vol_matched': self._safe_int(item.get('foreignBuyVolMatched')),
-                    'foreign_buy_vol_deal': self._safe_int(item.get('foreignBuyVolDeal')),
-                    
-                    # Trading statistics
-                    'total_buy_trade': self._safe_int(item.get('totalBuyTrade')),
-                    'total_buy_trade_vol': self._safe_int(item.get('totalBuyTradeVol')),
-                    'total_sell_trade': self._safe_int(item.get('totalSellTrade')),
-                    'total_sell_trade_vol': self._safe_int(item.get('totalSellTradeVol')),
-                    'net_buy_sell_vol': self._safe_int(item.get('netBuySellVol')),
-                    'net_buy_sell_val': self._safe_int(item.get('netBuySellVal')),
-                    
-                    # Raw prices
-                    'close_raw': self._safe_float(item.get('closeRaw')),
-                    'open_raw': self._safe_float(item.get('openRaw')),
-                    'high_raw': self._safe_float(item.get('highRaw')),
-                    'low_raw': self._safe_float(item.get('lowRaw'))
-                }
-                
-                if not self.config.dry_run:
-                    success = self.save_to_api('stock-statistics', stats_data)
-                    if success:
-                        saved_count += 1
-                        self.stats['stock_statistics_saved'] += 1
-                    else:
-                        self.stats['errors'] += 1
+            if stats_batch.empty or self.config.dry_run:
+                return 0
             
-            logger.info(f"Saved {saved_count} stock statistics records for {symbol}")
-            return saved_count
+            await self._submit_rows('stock-statistics/bulk', stats_batch, 'stock_statistics_saved', symbol)
+            return len(stats_batch)
             
         except Exception as e:
             logger.error(f"Error processing stock info for {symbol}: {e}")
             self.stats['errors'] += 1
             return 0
     
-    def _safe_float(self, value: Any) -> Optional[float]:
-        """Safely convert value to float"""
-        if value is None or value == '':
-            return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-    
-    def _safe_int(self, value: Any) -> Optional[int]:
-        """Safely convert value to int"""
-        if value is None or value == '':
-            return None
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return None
+    def _build_stats_frame(self, symbol: str, items: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Build stock statistics columns from SSI stock info items, one row per trading day"""
+        df = pd.DataFrame(items)
+        if 'tradingDate' not in df:
+            df['tradingDate'] = None
+        
+        # Parse trading dates in one pass; blank or malformed dates fall back to today
+        trading_dates = pd.to_datetime(df['tradingDate'], format='%d/%m/%Y', errors='coerce')
+        present = df['tradingDate'].notna() & (df['tradingDate'] != '')
+        for trading_date in df.loc[present & trading_dates.isna(), 'tradingDate']:
+            logger.warning(f"Could not parse date: {trading_date}")
+        
+        # Complete stock statistics data; unparseable values stay missing and are sent as null
+        stats = pd.DataFrame(index=df.index)
+        stats['symbol'] = symbol
+        stats['date'] = trading_dates.dt.strftime('%Y-%m-%d').fillna(date.today().isoformat())
+        # Latest date actually reported by SSI; the today fallback above must not move the cursor
+        last_trading_date = trading_dates.max()
+        stats.attrs['last_trading_date'] = None if pd.isna(last_trading_date) else last_trading_date.date().isoformat()
+        for column, source, kind in STATS_FIELD_MAP:
+            if source in df:
+                values = pd.to_numeric(df[source], errors='coerce')
+            else:
+                values = pd.Series(np.nan, index=df.index)
+            if kind is int:
+                values = values.where(values % 1 == 0).astype('Int64')
+            stats[column] = values
+        
+        # Kept as columns until serialization instead of one dict per row
+        return stats
     
-    def fetch_charts_history(self, symbol: str, resolution: str, start_date: date, end_date: date) -> Optional[Dict[str, Any]]:
+    async def fetch_charts_history(self, symbol: str, resolution: str, start_date: date, end_date: date) -> Optional[Dict[str, Any]]:
         """Fetch charts history with complete field mapping"""
         try:
-            url = "https://iboard-api.ssi.com.vn/statistics/charts/history"
+            from_ts, to_ts = _epoch_range(start_date, end_date)
             params = {
                 'resolution': resolution,
                 'symbol': symbol,
-                'from': int(datetime.combine(start_date, datetime.min.time()).timestamp()),
-                'to': int(datetime.combine(end_date, datetime.max.time()).timestamp())
+                'from': from_ts,
+                'to': to_ts
             }
             
-            response = self.session.get(url, params=params, timeout=self.config.request_timeout)
+            response = await self.session.get(SSI_CHARTS_HISTORY_URL, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"Fetched charts history for {symbol}: {len(data.get('data', {}).get('t', []))} data points")
             return data
             
@@ -436,7 +546,7 @@ class ExtendedSSIPipeline:
             logger.error(f"Error fetching charts history for {symbol}: {e}")
             return None
     
-    def process_charts_history(self, symbol: str, charts_data: Dict[str, Any]) -> int:
+    async def process_charts_history(self, symbol: str, charts_data: Dict[str, Any]) -> int:
         """Process charts history data with complete field mapping"""
         try:
             if not isinstance(charts_data, dict) or 'data' not in charts_data:
@@ -444,97 +554,236 @@ class ExtendedSSIPipeline:
                 return 0
             
             chart_data = charts_data['data']
-            saved_count = 0
-            
-            if isinstance(chart_data, dict) and 't' in chart_data:
-                # Format: {"t": [timestamps], "c": [close], "o": [open], "h": [high], "l": [low], "v": [volume]}
-                timestamps = chart_data.get('t', [])
-                closes = chart_data.get('c', [])
-                opens = chart_data.get('o', [])
-                highs = chart_data.get('h', [])
-                lows = chart_data.get('l', [])
-                volumes = chart_data.get('v', [])
-                
-                # Process each data point
-                for i in range(len(timestamps)):
-                    if i < len(timestamps):
-                        price_data = {
-                            'symbol': symbol,
-                            'timestamp': datetime.fromtimestamp(timestamps[i]).isoformat(),
-                            'resolution': self.config.resolution,
-                            'open_price': opens[i] if i < len(opens) else None,
-                            'high_price': highs[i] if i < len(highs) else None,
-                            'low_price': lows[i] if i < len(lows) else None,
-                            'close_price': closes[i] if i < len(closes) else None,
-                            'volume': volumes[i] if i < len(volumes) else None,
-                            'value': None,  # Not available in this format
-                            'status': chart_data.get('s'),
-                            'next_time': self._convert_timestamp(chart_data.get('nextTime'))
-                        }
-                        
-                        if not self.config.dry_run:
-                            success = self.save_to_api('stock-prices', price_data)
-                            if success:
-                                saved_count += 1
-                                self.stats['stock_prices_saved'] += 1
-                            else:
-                                self.stats['errors'] += 1
-            
-            logger.info(f"Saved {saved_count} stock price records for {symbol}")
-            return saved_count
+            
+            # Format: {"t": [timestamps], "c": [close], "o": [open], "h": [high], "l": [low], "v": [volume]}
+            if not isinstance(chart_data, dict) or not chart_data.get('t'):
+                return 0
+            
+            price_batch = self._build_price_frame(symbol, chart_data)
+            if self.config.dry_run:
+                return 0
+            
+            await self._submit_rows('stock-prices/bulk', price_batch, 'stock_prices_saved', symbol)
+            return len(price_batch)
             
         except Exception as e:
             logger.error(f"Error processing charts history for {symbol}: {e}")
             self.stats['errors'] += 1
             return 0
     
-    def save_to_api(self, endpoint: str, data: Dict[str, Any]) -> bool:
+    def _build_price_frame(self, symbol: str, chart_data: Dict[str, Any]) -> pd.DataFrame:
+        """Build stock price columns from the chart arrays, one row per timestamp"""
+        timestamps = chart_data['t']
+        size = len(timestamps)
+        
+        # datetime64 is UTC, so shift by the local offset to match datetime.fromtimestamp
+        utc_offset = datetime.now().astimezone().utcoffset().total_seconds()
+        local_times = pd.to_datetime(np.asarray(timestamps, dtype='float64') + utc_offset, unit='s')
+        
+        index = pd.RangeIndex(size)
+        
+        def column(key: str) -> Any:
+            # SSI returns aligned arrays; only a short one is padded with NaN (null in the request body)
+            values = chart_data.get(key, [])[:size]
+            return values if len(values) == size else pd.Series(values).reindex(index)
+        
+        df = pd.DataFrame({
+            'symbol': symbol,
+            'timestamp': local_times.strftime('%Y-%m-%dT%H:%M:%S'),
+            'resolution': self.config.resolution,
+            'open_price': column('o'),
+            'high_price': column('h'),
+            'low_price': column('l'),
+            'close_price': column('c'),
+            'volume': column('v'),
+            'value': None,  # Not available in this format
+            'status': chart_data.get('s'),
+            'next_time': self._convert_timestamp(chart_data.get('nextTime'))
+        }, index=index)
+        
+        # Serialized straight from the columns by save_to_api
+        return df
+    
+    async def save_to_api(self, endpoint: str, data: Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame]) -> bool:
         """Save data to API endpoint"""
         try:
             url = f"{self.config.api_base_url}/{endpoint}"
+            if isinstance(data, pd.DataFrame):
+                body = data.to_json(orient='records', double_precision=15).encode()
+            else:
+                body = orjson.dumps(data)
             
-            for attempt in range(self.config.max_retries):
-                try:
-                    response = requests.post(url, json=data, timeout=self.config.request_timeout)
-                    
-                    if response.status_code in [200, 201]:
-                        return True
-                    elif response.status_code == 422:
-                        logger.warning(f"Validation error for {endpoint}: {response.text}")
-                        return False
-                    else:
-                        logger.warning(f"Failed to save to {endpoint}: {response.status_code} - {response.text}")
-                        
-                except requests.exceptions.RequestException as e:
-                    logger.warning(f"Request error for {endpoint} (attempt {attempt + 1}): {e}")
-                    
-                if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay * (2 ** attempt))
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception(_is_retryable_save_error),
+                wait=wait_exponential_jitter(initial=self.config.retry_delay, max=10),
+                stop=stop_after_attempt(self.config.max_retries),
+                before_sleep=before_sleep_log(logger, logging.WARNING),
+                reraise=True
+            ):
+                with attempt:
+                    response = await self.session.post(url, content=body, headers={'Content-Type': 'application/json'})
+                    response.raise_for_status()
             
+            return True
+            
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 422:
+                logger.warning(f"Validation error for {endpoint}: {e.response.text}")
+            else:
+                logger.warning(f"Failed to save to {endpoint}: {e.response.status_code} - {e.response.text}")
             return False
             
         except Exception as e:
             logger.error(f"Error saving to API {endpoint}: {e}")
             return False
     
-    def get_last_update_date(self, symbol: str) -> Optional[date]:
-        """Get the last update date for a symbol from database"""
+    async def save_batch_to_api(self, endpoint: str, rows: Union[List[Dict[str, Any]], pd.DataFrame]) -> int:
+        """Save rows to a bulk endpoint in sub-batches and return the number of rows saved"""
+        batch_size = self.config.bulk_batch_size
+        chunks = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+        results = await asyncio.gather(*(self.save_to_api(endpoint, chunk) for chunk in chunks))
+        
+        # Each bulk request is one transaction, so a chunk is saved entirely or not at all
+        return sum(len(chunk) for chunk, success in zip(chunks, results) if success)
+    
+    async def preload_last_updates(self, symbols: List[str]) -> Dict[str, Optional[date]]:
+        """Fetch the last update date of every symbol in one request and cache it"""
+        fresh = time.monotonic() - self._last_update_loaded_at < self.config.last_update_cache_ttl
+        if fresh and all(symbol in self._last_update_cache for symbol in symbols):
+            return self._last_update_cache
+        
+        # Symbols already in the local cursor need no round-trip
+        cursor_dates = self._read_cursor('stock-statistics')
+        self._last_update_cache.update({
+            symbol: cursor_dates[symbol] for symbol in symbols if symbol in cursor_dates
+        })
+        missing = [symbol for symbol in symbols if symbol not in cursor_dates]
+        if not missing:
+            self._last_update_loaded_at = time.monotonic()
+            logger.info(f"Loaded last update dates for {len(symbols)} symbols from the local cursor")
+            return self._last_update_cache
+        
+        try:
+            url = f"{self.config.api_base_url}/stock-statistics/last-update"
+            response = await self.session.get(url, params={'symbols': ','.join(missing)})
+            response.raise_for_status()
+            
+            last_dates = orjson.loads(response.content)
+            self._last_update_cache.update({
+                symbol: date.fromisoformat(last_dates[symbol]) if symbol in last_dates else None
+                for symbol in missing
+            })
+            self._last_update_loaded_at = time.monotonic()
+            logger.info(f"Preloaded last update dates for {len(missing)} symbols "
+                        f"({len(symbols) - len(missing)} from the local cursor)")
+            
+        except Exception as e:
+            logger.warning(f"Could not preload last update dates, querying per symbol: {e}")
+        
+        return self._last_update_cache
+    
+    async def _save_rows(self, endpoint: str, rows: Union[List[Dict[str, Any]], pd.DataFrame], stat_key: str, symbol: str) -> int:
+        """Save rows through a bulk endpoint and record the outcome in the statistics"""
+        saved_count = await self.save_batch_to_api(endpoint, rows)
+        self.stats[stat_key] += saved_count
+        self.stats['errors'] += len(rows) - saved_count
+        logger.info(f"Saved {saved_count} {endpoint.split('/')[0].replace('-', ' ')} records for {symbol}")
+        
+        # Only a fully saved batch may move the cursor, otherwise the gap would never be refetched
+        if endpoint == 'stock-statistics/bulk' and len(rows) and saved_count == len(rows):
+            last_trading_date = rows.attrs.get('last_trading_date')
+            if last_trading_date:
+                self._advance_cursor('stock-statistics', symbol, last_trading_date)
+        return saved_count
+    
+    async def _submit_rows(self, endpoint: str, rows: Union[List[Dict[str, Any]], pd.DataFrame], stat_key: str, symbol: str) -> None:
+        """Queue rows for the save workers, or save them inline when no run is active"""
+        if self._save_queue is None:
+            await self._save_rows(endpoint, rows, stat_key, symbol)
+        else:
+            await self._save_queue.put((endpoint, rows, stat_key, symbol))
+    
+    async def _save_worker(self) -> None:
+        """Post queued row batches until cancelled"""
+        while True:
+            job = await self._save_queue.get()
+            try:
+                await self._save_rows(*job)
+            finally:
+                self._save_queue.task_done()
+    
+    def _open_cursor(self) -> Optional[sqlite3.Connection]:
+        """Open the local last-update cursor, or return None when it is disabled or unavailable"""
+        cursor_path = self.config.cursor_path
+        if cursor_path is None:
+            return None
+        
+        try:
+            cursor_path = Path(cursor_path).expanduser()
+            cursor_path.parent.mkdir(parents=True, exist_ok=True)
+            cursor_db = sqlite3.connect(cursor_path, isolation_level=None)
+            cursor_db.execute(
+                "CREATE TABLE IF NOT EXISTS cursor ("
+                "endpoint TEXT NOT NULL, symbol TEXT NOT NULL, last_date TEXT NOT NULL, "
+                "PRIMARY KEY (endpoint, symbol))"
+            )
+            if self.config.rebuild_cursor:
+                cursor_db.execute("DELETE FROM cursor")
+                logger.info(f"Cleared local cursor {cursor_path}")
+            return cursor_db
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Local cursor unavailable, using the API for last update dates: {e}")
+            return None
+    
+    def _read_cursor(self, endpoint: str) -> Dict[str, date]:
+        """Return the last saved date per symbol recorded for an endpoint"""
+        if self._cursor_db is None:
+            return {}
+        
+        rows = self._cursor_db.execute(
+            "SELECT symbol, last_date FROM cursor WHERE endpoint = ?", (endpoint,)
+        ).fetchall()
+        return {symbol: date.fromisoformat(last_date) for symbol, last_date in rows}
+    
+    def _advance_cursor(self, endpoint: str, symbol: str, last_date: str) -> None:
+        """Record a saved date for a symbol, never moving the cursor backwards"""
+        if self._cursor_db is None:
+            return
+        
+        try:
+            self._cursor_db.execute(
+                "INSERT INTO cursor (endpoint, symbol, last_date) VALUES (?, ?, ?) "
+                "ON CONFLICT (endpoint, symbol) DO UPDATE SET last_date = max(last_date, excluded.last_date)",
+                (endpoint, symbol, last_date[:10])
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update local cursor for {symbol}: {e}")
+    
+    async def get_last_update_date(self, symbol: str) -> Optional[date]:
+        """Get the last update date for a symbol from the local cursor or the database"""
+        if symbol in self._last_update_cache:
+            return self._last_update_cache[symbol]
+        
+        cursor_dates = self._read_cursor('stock-statistics')
+        if symbol in cursor_dates:
+            return cursor_dates[symbol]
+        
         try:
             url = f"{self.config.api_base_url}/stock-statistics"
             params = {
                 'symbol': symbol
             }
             
-            response = self.session.get(url, params=params, timeout=30)
+            response = await self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             if data and len(data) > 0:
                 # Get the most recent record (first in the list)
                 last_record = data[0]
                 last_date_str = last_record.get('date')
                 if last_date_str:
-                    return datetime.strptime(last_date_str, '%Y-%m-%d').date()
+                    return date.fromisoformat(last_date_str)
             
             return None
             
@@ -552,10 +801,10 @@ class ExtendedSSIPipeline:
         
         return start_date, end_date
     
-    def get_date_range_for_symbol(self, symbol: str) -> Tuple[date, date]:
+    async def get_date_range_for_symbol(self, symbol: str) -> Tuple[date, date]:
         """Get date range for a specific symbol with incremental logic"""
         # Get last update date from database
-        last_update = self.get_last_update_date(symbol)
+        last_update = await self.get_last_update_date(symbol)
         
         # Calculate start date
         if last_update:
@@ -585,22 +834,68 @@ class ExtendedSSIPipeline:
         
         return start_date, end_date
     
-    def run_pipeline(self) -> Dict[str, Any]:
-        """Run the complete extended pipeline"""
+    async def process_symbol(self, symbol: str, index: int, total: int) -> None:
+        """Fetch and save stock info and charts history for one symbol"""
+        async with self._symbol_slots:
+            logger.info(f"Processing {symbol} ({index}/{total})")
+            
+            # Get date range for this specific symbol
+            if self.config.incremental_mode:
+                start_date, end_date = await self.get_date_range_for_symbol(symbol)
+                logger.info(f"Date range for {symbol}: {start_date} to {end_date}")
+                
+                # Skip if no new data needed
+                if start_date > end_date:
+                    logger.info(f"Skipping {symbol} - no new data needed")
+                    return
+            else:
+                # Use global date range for non-incremental mode
+                start_date, end_date = self.get_date_range()
+                logger.info(f"Using global date range for {symbol}: {start_date} to {end_date}")
+            
+            # Fetch stock info and charts history concurrently
+            stock_info, charts_data = await asyncio.gather(
+                self.fetch_stock_info(symbol, start_date, end_date),
+                self.fetch_charts_history(symbol, self.config.resolution, start_date, end_date)
+            )
+            
+            if stock_info:
+                await self.process_stock_info(symbol, stock_info)
+            
+            if charts_data:
+                await self.process_charts_history(symbol, charts_data)
+            
+            # Rate limiting
+            await asyncio.sleep(self.config.rate_limit_delay)
+    
+    async def run_pipeline_async(self) -> Dict[str, Any]:
+        """Run the complete extended pipeline, processing symbols concurrently"""
         logger.info("Starting Extended SSI Pipeline v2.0 - Complete Data Coverage")
         logger.info(f"Configuration: {self.config}")
         
+        if self.session.is_closed:
+            self.session = self._create_session()
+        self._symbol_slots = asyncio.Semaphore(self.config.max_concurrency)
+        if self._cursor_db is None:
+            self._cursor_db = self._open_cursor()
+        
+        # Saves run in their own workers so fetching the next symbols is not held up by POSTs
+        self._save_queue = asyncio.Queue(maxsize=self.config.save_queue_size)
+        save_workers = [asyncio.create_task(self._save_worker()) for _ in range(self.config.save_workers)]
+        
         try:
             # Step 1: Fetch VN100 data
             logger.info("Step 1: Fetching VN100 data...")
-            vn100_data = self.fetch_vn100_data()
+            vn100_data = await self.fetch_vn100_data()
             if not vn100_data:
                 logger.error("Failed to fetch VN100 data")
                 return self.stats
             
             # Step 2: Process VN100 components
             logger.info("Step 2: Processing VN100 components...")
-            symbols = self.process_vn100_components(vn100_data)
+            symbols = await self.process_vn100_components(vn100_data)
+            # Only the symbol list is needed from here on; drop the full component payload
+            del vn100_data
             if not symbols:
                 logger.error("No symbols found in VN100 data")
                 return self.stats
@@ -615,38 +910,15 @@ class ExtendedSSIPipeline:
                 symbols = self.config.symbols
                 logger.info(f"Using custom symbols: {symbols}")
             
-            # Step 5: Process each symbol with incremental date range
+            # Step 5: Process symbols concurrently with incremental date range
             logger.info(f"Step 5: Processing {len(symbols)} symbols with incremental logic...")
-            for i, symbol in enumerate(symbols, 1):
-                logger.info(f"Processing {symbol} ({i}/{len(symbols)})")
-                
-                # Get date range for this specific symbol
-                if self.config.incremental_mode:
-                    start_date, end_date = self.get_date_range_for_symbol(symbol)
-                    logger.info(f"Date range for {symbol}: {start_date} to {end_date}")
-                    
-                    # Skip if no new data needed
-                    if start_date > end_date:
-                        logger.info(f"Skipping {symbol} - no new data needed")
-                        continue
-                else:
-                    # Use global date range for non-incremental mode
-                    start_date, end_date = self.get_date_range()
-                    logger.info(f"Using global date range for {symbol}: {start_date} to {end_date}")
-                
-                # Fetch stock info
-                stock_info = self.fetch_stock_info(symbol, start_date, end_date)
-                if stock_info:
-                    self.process_stock_info(symbol, stock_info)
-                
-                # Fetch charts history
-                charts_data = self.fetch_charts_history(symbol, self.config.resolution, start_date, end_date)
-                if charts_data:
-                    self.process_charts_history(symbol, charts_data)
-                
-                # Rate limiting
-                if i < len(symbols):
-                    time.sleep(self.config.rate_limit_delay)
+            if self.config.incremental_mode:
+                await self.preload_last_updates(symbols)
+            await asyncio.gather(*(
+                self.process_symbol(symbol, i, len(symbols))
+                for i, symbol in enumerate(symbols, 1)
+            ))
+            await self._save_queue.join()
             
             # Calculate final statistics
             self.stats['end_time'] = datetime.now()
@@ -661,6 +933,20 @@ class ExtendedSSIPipeline:
             logger.error(f"Pipeline failed: {e}")
             self.stats['errors'] += 1
             return self.stats
+        
+        finally:
+            for worker in save_workers:
+                worker.cancel()
+            await asyncio.gather(*save_workers, return_exceptions=True)
+            self._save_queue = None
+            if self._cursor_db is not None:
+                self._cursor_db.close()
+                self._cursor_db = None
+            await self.session.aclose()
+    
+    def run_pipeline(self) -> Dict[str, Any]:
+        """Run the complete extended pipeline"""
+        return asyncio.run(self.run_pipeline_async())
 
 def main():
     """Main function with command line interface"""
@@ -677,6 +963,7 @@ def main():
     # Incremental mode
     parser.add_argument('--incremental', action='store_true', default=True, help='Enable incremental mode (default)')
     parser.add_argument('--no-incremental', action='store_true', help='Disable incremental mode')
+    parser.add_argument('--rebuild-cursor', action='store_true', help='Clear the local last-update cursor before running')
     
     # API configuration
     parser.add_argument('--api-url', type=str, default='http://localhost:8000', help='API base URL')
@@ -707,6 +994,7 @@ def main():
         end_date=end_date,
         resolution=args.resolution,
         incremental_mode=not args.no_incremental,  # Enable unless explicitly disabled
+        rebuild_cursor=args.rebuild_cursor,
         api_base_url=args.api_url,
         max_retries=args.retries,
         request_timeout=args.timeout,
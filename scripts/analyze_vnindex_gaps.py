@@ -16,48 +16,41 @@ Features:
 from __future__ import annotations
 
 import argparse
-import csv
 import os
 import sys
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Set, Tuple
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 
-def load_csv_data(file_path: str) -> List[Dict[str, any]]:
-    """Load CSV data into a list of dictionaries"""
-    data = []
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            row['date'] = datetime.strptime(row['date'], '%Y-%m-%d').date()
-            row['open'] = float(row['open']) if row['open'] else None
-            row['high'] = float(row['high']) if row['high'] else None
-            row['low'] = float(row['low']) if row['low'] else None
-            row['close'] = float(row['close']) if row['close'] else None
-            row['volume'] = int(row['volume']) if row['volume'] else 0
-            data.append(row)
+def load_csv_data(file_path: str) -> pd.DataFrame:
+    """Load CSV data into a DataFrame (empty prices become NaN, empty volumes 0)"""
+    data = pd.read_csv(
+        file_path,
+        encoding='utf-8',
+        parse_dates=['date'],
+        date_format='%Y-%m-%d',
+        float_precision='round_trip',
+        dtype={'open': 'float64', 'high': 'float64', 'low': 'float64', 'close': 'float64', 'volume': 'Int64'}
+    )
+    data['volume'] = data['volume'].fillna(0)
     return data
 
 
-def get_expected_trading_days(start_date: date, end_date: date) -> Set[date]:
-    """Get all expected trading days (excluding weekends)"""
-    trading_days = set()
-    current_date = start_date
-    
-    while current_date <= end_date:
-        # Skip weekends (Saturday = 5, Sunday = 6)
-        if current_date.weekday() < 5:
-            trading_days.add(current_date)
-        current_date += timedelta(days=1)
-    
-    return trading_days
+def get_expected_trading_days(start_date: date, end_date: date, holidays: Optional[Iterable[date]] = None) -> Set[date]:
+    """Get all expected trading days (excluding weekends and any given holidays)"""
+    if holidays:
+        business_days = pd.bdate_range(start_date, end_date, freq='C', holidays=list(holidays))
+    else:
+        business_days = pd.bdate_range(start_date, end_date)
+    return set(business_days.date)
 
 
-def get_actual_trading_days(data: List[Dict[str, any]]) -> Set[date]:
+def get_actual_trading_days(data: pd.DataFrame) -> Set[date]:
     """Get actual trading days from data"""
-    return {row['date'] for row in data}
+    return set(data['date'].dt.date)
 
 
 def identify_missing_days(expected_days: Set[date], actual_days: Set[date]) -> Set[date]:
@@ -65,37 +58,40 @@ def identify_missing_days(expected_days: Set[date], actual_days: Set[date]) -> S
     return expected_days - actual_days
 
 
-def analyze_data_gaps(data: List[Dict[str, any]]) -> Dict[str, any]:
+def analyze_data_gaps(data: pd.DataFrame) -> Dict[str, any]:
     """Analyze data for gaps and patterns"""
-    if not data:
+    if data.empty:
         return {}
     
-    # Sort data by date
-    data.sort(key=lambda x: x['date'])
-    
-    gaps = []
-    prev_date = None
-    
-    for row in data:
-        current_date = row['date']
-        if prev_date:
-            days_diff = (current_date - prev_date).days
-            if days_diff > 1:
-                gaps.append({
-                    'start': prev_date,
-                    'end': current_date,
-                    'gap_days': days_diff - 1,
-                    'gap_type': 'weekend' if days_diff <= 3 else 'holiday_or_missing'
-                })
-        prev_date = current_date
+    # Day differences between consecutive sorted dates, computed in one pass
+    dates = np.sort(data['date'].to_numpy(dtype='datetime64[D]'))
+    deltas = np.diff(dates).astype('int64')
+    gap_idx = np.flatnonzero(deltas > 1)
+    gap_types = np.where(deltas[gap_idx] <= 3, 'weekend', 'holiday_or_missing')
+    
+    gaps = [
+        {
+            'start': start,
+            'end': end,
+            'gap_days': days_diff - 1,
+            'gap_type': gap_type
+        }
+        for start, end, days_diff, gap_type in zip(
+            dates[gap_idx].tolist(),
+            dates[gap_idx + 1].tolist(),
+            deltas[gap_idx].tolist(),
+            gap_types.tolist()
+        )
+    ]
+    weekend_gaps = int(np.count_nonzero(gap_types == 'weekend'))
     
     return {
         'total_records': len(data),
-        'date_range': f"{data[0]['date']} to {data[-1]['date']}",
+        'date_range': f"{dates[0].item()} to {dates[-1].item()}",
         'gaps': gaps,
         'total_gaps': len(gaps),
-        'weekend_gaps': len([g for g in gaps if g['gap_type'] == 'weekend']),
-        'holiday_gaps': len([g for g in gaps if g['gap_type'] == 'holiday_or_missing']),
+        'weekend_gaps': weekend_gaps,
+        'holiday_gaps': len(gaps) - weekend_gaps,
     }
 
 
@@ -171,27 +167,20 @@ def print_analysis_report(analysis: Dict[str, any], missing_report: Dict[str, an
     print("=" * 80)
 
 
-def create_clean_csv(data: List[Dict[str, any]], output_path: str):
-    """Create a clean CSV file with proper formatting"""
+def create_clean_csv(data: pd.DataFrame, output_path: str):
+    """Create a clean CSV file with proper formatting, sorted by date"""
     fieldnames = ["date", "open", "high", "low", "close", "volume"]
     
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for row in data:
-            # Convert date back to string for CSV
-            csv_row = {
-                'date': row['date'].strftime('%Y-%m-%d'),
-                'open': row['open'],
-                'high': row['high'],
-                'low': row['low'],
-                'close': row['close'],
-                'volume': row['volume']
-            }
-            writer.writerow(csv_row)
+    data.sort_values('date', kind='stable').to_csv(
+        output_path,
+        columns=fieldnames,
+        index=False,
+        date_format='%Y-%m-%d',
+        encoding='utf-8',
+        lineterminator='\r\n'  # same line endings as csv.writer
+    )
 
 
 def main():
@@ -209,7 +198,7 @@ def main():
         print("Loading VN-Index data...")
         data = load_csv_data(args.input)
         
-        if not data:
+        if data.empty:
             print("Error: No data found in input file")
             return 1
         
@@ -218,8 +207,8 @@ def main():
             start_date = datetime.strptime(args.start_date, '%Y-%m-%d').date()
             end_date = datetime.strptime(args.end_date, '%Y-%m-%d').date()
         else:
-            start_date = data[0]['date']
-            end_date = data[-1]['date']
+            start_date = data['date'].iloc[0].date()
+            end_date = data['date'].iloc[-1].date()
         
         print(f"Analyzing data from {start_date} to {end_date}...")
         
@@ -3,16 +3,67 @@
 Export OHLCV data for all VN100 symbols from 2020-01-01 to today
 """
 
+import asyncio
 import os
 import sys
-import time
 from datetime import date
 from pathlib import Path
+from typing import List, Optional, Tuple
+
+import httpx
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from automation.automation_vn100_direct import DirectVN100Automation, AutomationConfig
+from scripts.export_ssi_automation_style import ExportConfig, create_async_client, fetch_all_async, output_path, write_csv
+
+# Symbols exported at the same time; each one still paces its own page requests
+MAX_WORKERS = 8
+EXPORT_START_DATE = date(2020, 1, 1)
+
+
+async def fetch_symbols(automation: DirectVN100Automation):
+    """Fetch VN100 symbols and release the automation's HTTP client"""
+    try:
+        return await automation.fetch_vn100_symbols()
+    finally:
+        await automation.aclose()
+
+
+async def export_symbol(client: httpx.AsyncClient, slots: asyncio.Semaphore, symbol: str, end_date: date, output_dir: str) -> Tuple[str, Optional[Exception]]:
+    """Fetch one symbol's daily history and write it to CSV, returning the symbol and any error"""
+    config = ExportConfig(
+        symbol=symbol,
+        start_date=EXPORT_START_DATE,
+        end_date=end_date,
+        output_dir=output_dir
+    )
+    try:
+        async with slots:
+            rows = await fetch_all_async(config, client)
+        write_csv(rows, output_path(config))
+        return symbol, None
+    except Exception as e:
+        return symbol, e
+
+
+async def export_symbols(symbols: List[str], end_date: date, output_dir: str) -> List[str]:
+    """Export symbols concurrently over one HTTP/2 client, returning the symbols that failed"""
+    failed_symbols = []
+    slots = asyncio.Semaphore(MAX_WORKERS)
+    
+    async with create_async_client() as client:
+        tasks = [export_symbol(client, slots, symbol, end_date, output_dir) for symbol in symbols]
+        for i, task in enumerate(asyncio.as_completed(tasks), 1):
+            symbol, error = await task
+            if error is None:
+                print(f"✅ [{i}/{len(symbols)}] {symbol} exported successfully")
+            else:
+                failed_symbols.append(symbol)
+                print(f"❌ [{i}/{len(symbols)}] {symbol} export error: {error}")
+    
+    return failed_symbols
 
 
 def export_all_vn100():
@@ -27,7 +78,7 @@ def export_all_vn100():
     automation = DirectVN100Automation(config)
     
     # Fetch VN100 symbols
-    symbols = automation.fetch_vn100_symbols()
+    symbols = asyncio.run(fetch_symbols(automation))
     if not symbols:
         print("❌ No VN100 symbols found")
         return False
@@ -35,31 +86,9 @@ def export_all_vn100():
     print(f"📊 Found {len(symbols)} VN100 symbols: {symbols}")
     print(f"📁 Output directory: {output_dir}")
     
-    # Export each symbol
-    success_count = 0
-    failed_symbols = []
-    
-    for i, symbol in enumerate(symbols, 1):
-        print(f"\n🔄 [{i}/{len(symbols)}] Exporting {symbol}...")
-        
-        try:
-            # Run export command
-            cmd = f"python3 scripts/export_ssi_automation_style.py --symbol {symbol} --start 2020-01-01 --end $(date +%F) --output-dir {output_dir}"
-            result = os.system(cmd)
-            
-            if result == 0:
-                success_count += 1
-                print(f"✅ {symbol} exported successfully")
-            else:
-                failed_symbols.append(symbol)
-                print(f"❌ {symbol} export failed")
-                
-        except Exception as e:
-            failed_symbols.append(symbol)
-            print(f"❌ {symbol} export error: {e}")
-        
-        # Add delay to avoid rate limiting
-        time.sleep(1)
+    # Export symbols concurrently in this process
+    failed_symbols = asyncio.run(export_symbols(symbols, date.today(), output_dir))
+    success_count = len(symbols) - len(failed_symbols)
     
     # Summary
     print(f"\n📊 EXPORT SUMMARY")
@@ -8,15 +8,22 @@ Output: CSV compatible with pandas (date, open, high, low, close, volume)
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
+import json
 import os
+import sqlite3
 import sys
 import time
-from dataclasses import dataclass
-from datetime import date, datetime
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 @dataclass
@@ -29,6 +36,8 @@ class ExportConfig:
     timeout: float = 30.0
     output_dir: str = "/Users/macintoshhd/Project/Project/stock_playing/tracking_data/output"
     ssi_url: str = "https://iboard-api.ssi.com.vn/statistics/company/ssmi/stock-info"
+    # Pages of windows that ended before today are kept here; None disables the cache
+    page_cache_path: Optional[str] = str(Path.home() / '.cache' / 'ssi_export_pages.sqlite')
 
 
 def safe_float(value: Any) -> Optional[float]:
@@ -49,76 +58,235 @@ def safe_int(value: Any) -> Optional[int]:
         return None
 
 
-def fetch_all(config: ExportConfig) -> List[Dict[str, Any]]:
+SSI_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://iboard.ssi.com.vn/',
+    'Origin': 'https://iboard.ssi.com.vn'
+}
+
+
+def create_session() -> requests.Session:
     session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Referer': 'https://iboard.ssi.com.vn/',
-        'Origin': 'https://iboard.ssi.com.vn'
-    })
+    session.headers.update(SSI_HEADERS)
+    # Keep-alive pool for the single SSI host, sized for concurrent symbol exports
+    session.mount('https://', HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    return session
+
+
+def create_async_client(timeout: float = 30.0) -> httpx.AsyncClient:
+    # HTTP/2 multiplexes the concurrent symbol exports over one connection to SSI
+    return httpx.AsyncClient(
+        headers=SSI_HEADERS,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            retries=3
+        ),
+        timeout=timeout
+    )
 
-    all_rows: List[Dict[str, Any]] = []
-    page = 1
-
-    while page <= config.max_pages:
-        params = {
-            'symbol': config.symbol,
-            'page': page,
-            'pageSize': config.page_size,
-            'fromDate': config.start_date.strftime('%d/%m/%Y'),
-            'toDate': config.end_date.strftime('%d/%m/%Y')
-        }
-
-        resp = session.get(config.ssi_url, params=params, timeout=config.timeout)
-        resp.raise_for_status()
-        payload = resp.json()
-
-        data_list = payload.get('data', []) if isinstance(payload, dict) else []
-        paging = payload.get('paging', {}) if isinstance(payload, dict) else {}
-        total = paging.get('total', 0)
-        current_page_size = paging.get('pageSize', len(data_list))
-
-        if not data_list:
-            break
-
-        for item in data_list:
-            trading_date_str = item.get('tradingDate')
-            if not trading_date_str:
-                continue
-            try:
-                d = datetime.strptime(trading_date_str, '%d/%m/%Y').date()
-            except ValueError:
-                continue
-
-            if d < config.start_date or d > config.end_date:
-                continue
-
-            all_rows.append({
-                'date': d.isoformat(),
-                'open': safe_float(item.get('open')),
-                'high': safe_float(item.get('high')),
-                'low': safe_float(item.get('low')),
-                'close': safe_float(item.get('close')),
-                'volume': safe_int(item.get('volume'))
-            })
-
-        # Continue pages using paging.total if provided
-        if total and page * current_page_size >= total:
-            break
-        if not total and len(data_list) < config.page_size:
-            break
-
-        page += 1
-        time.sleep(0.1)
 
+# Shared by every fetch_all call in this process so connections are reused across symbols
+_SESSION = create_session()
+
+
+def _page_params(config: ExportConfig, page: int) -> Dict[str, Any]:
+    return {
+        'symbol': config.symbol,
+        'page': page,
+        'pageSize': config.page_size,
+        'fromDate': config.start_date.strftime('%d/%m/%Y'),
+        'toDate': config.end_date.strftime('%d/%m/%Y')
+    }
+
+
+# Only pages that carry rows are worth keeping; an empty or error page may be transient
+def _has_rows(payload: Any) -> bool:
+    return isinstance(payload, dict) and isinstance(payload.get('data'), list) and bool(payload['data'])
+
+
+# Appends the page's in-range rows to all_rows; returns whether another page follows
+def _collect_page(config: ExportConfig, page: int, payload: Any, all_rows: List[Dict[str, Any]]) -> bool:
+    if not _has_rows(payload):
+        return False
+
+    data_list = payload['data']
+    paging = payload.get('paging') or {}
+    total = paging.get('total', 0)
+    current_page_size = paging.get('pageSize', len(data_list))
+
+    for item in data_list:
+        trading_date_str = item.get('tradingDate')
+        if not trading_date_str:
+            continue
+        try:
+            d = datetime.strptime(trading_date_str, '%d/%m/%Y').date()
+        except ValueError:
+            continue
+
+        if d < config.start_date or d > config.end_date:
+            continue
+
+        all_rows.append({
+            'date': d.isoformat(),
+            'open': safe_float(item.get('open')),
+            'high': safe_float(item.get('high')),
+            'low': safe_float(item.get('low')),
+            'close': safe_float(item.get('close')),
+            'volume': safe_int(item.get('volume'))
+        })
+
+    # Continue pages using paging.total if provided
+    if total and page * current_page_size >= total:
+        return False
+    if not total and len(data_list) < config.page_size:
+        return False
+    return True
+
+
+# Splits the export window at the start of the current month so the closed, older part
+# always has the same fromDate/toDate and its pages can be served from the page cache
+def _split_window(config: ExportConfig) -> List[ExportConfig]:
+    closed_end = date.today().replace(day=1) - timedelta(days=1)
+    if config.end_date <= closed_end or config.start_date > closed_end:
+        return [config]
+    return [
+        replace(config, end_date=closed_end),
+        replace(config, start_date=closed_end + timedelta(days=1))
+    ]
+
+
+def _open_page_cache(config: ExportConfig) -> Optional[sqlite3.Connection]:
+    if config.page_cache_path is None:
+        return None
+    try:
+        os.makedirs(os.path.dirname(config.page_cache_path), exist_ok=True)
+        cache = sqlite3.connect(config.page_cache_path, isolation_level=None, check_same_thread=False)
+        cache.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "symbol TEXT NOT NULL, page INTEGER NOT NULL, page_size INTEGER NOT NULL, "
+            "from_date TEXT NOT NULL, to_date TEXT NOT NULL, payload TEXT NOT NULL, "
+            "PRIMARY KEY (symbol, page, page_size, from_date, to_date))"
+        )
+        return cache
+    except (OSError, sqlite3.Error) as e:
+        print(f"Page cache unavailable, fetching every page: {e}", file=sys.stderr)
+        return None
+
+
+def _page_key(config: ExportConfig, page: int) -> tuple:
+    return (config.symbol, page, config.page_size, config.start_date.isoformat(), config.end_date.isoformat())
+
+
+def _cached_page(cache: Optional[sqlite3.Connection], config: ExportConfig, page: int) -> Optional[Any]:
+    # Only windows that ended before today are immutable
+    if cache is None or config.end_date >= date.today():
+        return None
+    row = cache.execute(
+        "SELECT payload FROM pages WHERE symbol = ? AND page = ? AND page_size = ? AND from_date = ? AND to_date = ?",
+        _page_key(config, page)
+    ).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def _store_page(cache: Optional[sqlite3.Connection], config: ExportConfig, page: int, payload: Any, payload_text: str) -> None:
+    if cache is None or config.end_date >= date.today() or not _has_rows(payload):
+        return
+    try:
+        cache.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)", _page_key(config, page) + (payload_text,))
+    except sqlite3.Error as e:
+        print(f"Could not cache page {page} for {config.symbol}: {e}", file=sys.stderr)
+
+
+def _dedup_by_date(all_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     # Deduplicate by date (keep last), then sort by date asc
     dedup: Dict[str, Dict[str, Any]] = {}
     for r in all_rows:
         dedup[r['date']] = r
-    ordered = [dedup[k] for k in sorted(dedup.keys())]
-    return ordered
+    return [dedup[k] for k in sorted(dedup.keys())]
+
+
+def _page_driver(config: ExportConfig, all_rows: List[Dict[str, Any]]):
+    # Yields (window, page) for every page to load; send() the page payload back
+    for window in _split_window(config):
+        page = 1
+        while page <= window.max_pages:
+            payload = yield window, page
+            if not _collect_page(window, page, payload, all_rows):
+                break
+            page += 1
+
+
+def _next_page(pages, payload: Any = None) -> Optional[tuple]:
+    try:
+        return pages.send(payload)
+    except StopIteration:
+        return None
+
+
+def fetch_all(config: ExportConfig, session: requests.Session = _SESSION) -> List[Dict[str, Any]]:
+    all_rows: List[Dict[str, Any]] = []
+    cache = _open_page_cache(config)
+    pages = _page_driver(config, all_rows)
+    throttle = False
+
+    try:
+        request = _next_page(pages)
+        while request is not None:
+            window, page = request
+            payload = _cached_page(cache, window, page)
+            if payload is None:
+                if throttle:
+                    time.sleep(0.1)
+                resp = session.get(window.ssi_url, params=_page_params(window, page), timeout=window.timeout)
+                resp.raise_for_status()
+                payload = resp.json()
+                _store_page(cache, window, page, payload, resp.text)
+                throttle = True
+            request = _next_page(pages, payload)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    return _dedup_by_date(all_rows)
+
+
+async def fetch_all_async(config: ExportConfig, client: httpx.AsyncClient) -> List[Dict[str, Any]]:
+    all_rows: List[Dict[str, Any]] = []
+    # sqlite calls are blocking, so they run in worker threads off the event loop
+    cache = await asyncio.to_thread(_open_page_cache, config)
+    pages = _page_driver(config, all_rows)
+    throttle = False
+
+    try:
+        request = _next_page(pages)
+        while request is not None:
+            window, page = request
+            payload = await asyncio.to_thread(_cached_page, cache, window, page)
+            if payload is None:
+                if throttle:
+                    await asyncio.sleep(0.1)
+                resp = await client.get(window.ssi_url, params=_page_params(window, page), timeout=window.timeout)
+                resp.raise_for_status()
+                payload = resp.json()
+                await asyncio.to_thread(_store_page, cache, window, page, payload, resp.text)
+                throttle = True
+            request = _next_page(pages, payload)
+    finally:
+        if cache is not None:
+            await asyncio.to_thread(cache.close)
+
+    return _dedup_by_date(all_rows)
+
+
+def output_path(config: ExportConfig) -> str:
+    return os.path.join(config.output_dir, f"{config.symbol}_daily_{config.start_date.isoformat()}_{config.end_date.isoformat()}_full.csv")
 
 
 def write_csv(rows: List[Dict[str, Any]], out_path: str) -> None:
@@ -135,6 +303,7 @@ def main() -> int:
     parser.add_argument('--start', default='2020-01-01')
     parser.add_argument('--end', default=date.today().isoformat())
     parser.add_argument('--output-dir', default='/Users/macintoshhd/Project/Project/stock_playing/tracking_data/output')
+    parser.add_argument('--no-page-cache', action='store_true', help='Fetch every page instead of reusing cached past pages')
     args = parser.parse_args()
 
     start_d = datetime.strptime(args.start, '%Y-%m-%d').date()
@@ -146,9 +315,11 @@ def main() -> int:
         end_date=end_d,
         output_dir=args.output_dir
     )
+    if args.no_page_cache:
+        cfg.page_cache_path = None
 
     rows = fetch_all(cfg)
-    out_file = os.path.join(cfg.output_dir, f"{cfg.symbol}_daily_{cfg.start_date.isoformat()}_{cfg.end_date.isoformat()}_full.csv")
+    out_file = output_path(cfg)
     write_csv(rows, out_file)
     print(out_file)
     return 0
@@ -16,13 +16,26 @@ import sys
 import time
 from dataclasses import dataclass
 from datetime import date, datetime
+from urllib.parse import quote
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-import requests
+import httpx
 
 
 BASE_URL = "https://iboard-api.ssi.com.vn/statistics/company/ssmi/stock-info"
 
+# Shared HTTP/2 client: one TLS connection to SSI, multiplexed across requests
+CLIENT = httpx.Client(
+    http2=True,
+    headers={
+        "Accept": "application/json, text/plain, */*",
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/119.0.0.0 Safari/537.36",
+        "Referer": "https://iboard.ssi.com.vn/",
+        "Origin": "https://iboard.ssi.com.vn",
+    },
+    limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+)
+
 
 @dataclass
 class FetchConfig:
@@ -50,8 +63,8 @@ def build_url(config: FetchConfig, page: int) -> str:
         "fromDate": format_ddmmyyyy(config.start_date),
         "toDate": format_ddmmyyyy(config.end_date),
     }
-    # Manual querystring build to avoid adding requests dependency quirks
-    query = "&".join(f"{k}={requests.utils.quote(v)}" for k, v in params.items())
+    # Manual querystring build keeps the exact encoding of the original URLs
+    query = "&".join(f"{k}={quote(v)}" for k, v in params.items())
     return f"{BASE_URL}?{query}"
 
 
@@ -119,14 +132,7 @@ def try_int(v: Any) -> Optional[int]:
 
 def fetch_page(url: str, timeout: float) -> Dict[str, Any]:
     """Fetch a single page from API"""
-    headers = {
-        "Accept": "application/json, text/plain, */*",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/119.0.0.0 Safari/537.36",
-        "Referer": "https://iboard.ssi.com.vn/",
-        "Origin": "https://iboard.ssi.com.vn",
-        "Connection": "keep-alive",
-    }
-    resp = requests.get(url, headers=headers, timeout=timeout)
+    resp = CLIENT.get(url, timeout=timeout)
     resp.raise_for_status()
     return resp.json()
 
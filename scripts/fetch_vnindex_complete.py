@@ -26,9 +26,23 @@ import sys
 import time
 from dataclasses import dataclass
 from datetime import date, datetime
+from urllib.parse import quote
 from typing import Any, Dict, List, Optional
 
-import requests
+import httpx
+
+
+# Shared HTTP/2 client: one TLS connection to SSI, multiplexed across requests
+CLIENT = httpx.Client(
+    http2=True,
+    headers={
+        "Accept": "application/json, text/plain, */*",
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/119.0.0.0 Safari/537.36",
+        "Referer": "https://iboard.ssi.com.vn/",
+        "Origin": "https://iboard.ssi.com.vn",
+    },
+    limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+)
 
 
 @dataclass
@@ -63,27 +77,19 @@ def build_api_url(config: VNIndexConfig) -> str:
         "to": str(to_ts),
     }
     
-    query = "&".join(f"{k}={requests.utils.quote(v)}" for k, v in params.items())
+    query = "&".join(f"{k}={quote(v)}" for k, v in params.items())
     return f"{config.api_url}?{query}"
 
 
 def fetch_data_with_retry(url: str, config: VNIndexConfig) -> Dict[str, Any]:
     """Fetch data from API with retry logic"""
-    headers = {
-        "Accept": "application/json, text/plain, */*",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/119.0.0.0 Safari/537.36",
-        "Referer": "https://iboard.ssi.com.vn/",
-        "Origin": "https://iboard.ssi.com.vn",
-        "Connection": "keep-alive",
-    }
-    
     for attempt in range(config.retry_attempts):
         try:
             print(f"Fetching data (attempt {attempt + 1}/{config.retry_attempts})...")
-            resp = requests.get(url, headers=headers, timeout=config.timeout)
+            resp = CLIENT.get(url, timeout=config.timeout)
             resp.raise_for_status()
             return resp.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"Attempt {attempt + 1} failed: {e}")
             if attempt < config.retry_attempts - 1:
                 print(f"Retrying in {config.retry_delay} seconds...")
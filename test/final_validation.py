@@ -10,6 +10,7 @@ This test validates the entire extended system:
 - Data integrity
 """
 
+import asyncio
 import requests
 import json
 import time
@@ -190,14 +191,14 @@ def test_pipeline_functionality():
         print("  ✓ Pipeline configuration and methods working")
         
         # Test VN100 data fetching
-        vn100_data = pipeline.fetch_vn100_data()
+        vn100_data = asyncio.run(pipeline.fetch_vn100_data())
         assert vn100_data is not None
         assert 'data' in vn100_data
         assert len(vn100_data['data']) > 0
         print("  ✓ VN100 data fetching working")
         
         # Test processing VN100 components
-        symbols = pipeline.process_vn100_components(vn100_data)
+        symbols = asyncio.run(pipeline.process_vn100_components(vn100_data))
         assert len(symbols) > 0
         print(f"  ✓ VN100 processing returned {len(symbols)} symbols")
         
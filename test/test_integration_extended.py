@@ -29,6 +29,7 @@ class TestExtendedIntegration(unittest.TestCase):
     def setUpClass(cls):
         """Set up integration test environment"""
         cls.api_base_url = "http://localhost:8000"
+        cls.proxy_base_url = "http://localhost:8001"
         cls.test_symbols = ["ACB", "VCB", "VIC"]
         
         # Wait for API to be ready
@@ -322,7 +323,7 @@ class TestExtendedIntegration(unittest.TestCase):
         self.assertEqual(stats['symbol'], "VALID_TEST")
         self.assertEqual(stats['ceiling_price'], 28.0)
         self.assertEqual(stats['foreign_buy_vol_total'], 100000)
-        self.assertEqual(stats['net_buy_sell_vol'], 0)
+        self.assertEqual(stats['net_buy_sell_vol'], 50000)  # foreign_buy_vol_total - foreign_sell_vol_total
         
         # Clean up
         response = requests.delete(f"{self.api_base_url}/companies/VALID_TEST")
@@ -427,6 +428,186 @@ class TestExtendedIntegration(unittest.TestCase):
         
         self.assertGreater(successful_reads, 0)
         print(f"Concurrent access test: {successful_reads}/{len(self.test_symbols)} symbols read successfully")
+    
+    def test_10_bulk_statistics_copy_path(self):
+        """Test bulk statistics upsert large enough to use the COPY merge"""
+        symbol = "BULK_TEST"
+        response = requests.post(f"{self.api_base_url}/companies", json={
+            "symbol": symbol,
+            "company_name": "Bulk Copy Test Company"
+        })
+        self.assertEqual(response.status_code, 200)
+        
+        # 1200 rows is above the API's COPY threshold of 1000
+        start_date = date(2020, 1, 1)
+        rows = []
+        for i in range(1200):
+            rows.append({
+                "symbol": symbol,
+                "date": (start_date + timedelta(days=i)).isoformat(),
+                "current_price": 10 + i / 100,
+                "volume": 1000 + i,
+                "ceiling_price": 11 + i / 100,
+                "foreign_buy_vol_total": 3 * i,
+                "foreign_sell_vol_total": i,
+                "foreign_buy_val_total": 30 * i,
+                "foreign_sell_val_total": 50 * i
+            })
+        
+        response = requests.post(f"{self.api_base_url}/stock-statistics/bulk", json=rows, timeout=60)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"upserted": 1200, "symbols": [symbol]})
+        
+        # Upsert the same dates again with new prices through the COPY merge
+        for row in rows:
+            row["current_price"] += 1
+        response = requests.post(f"{self.api_base_url}/stock-statistics/bulk", json=rows, timeout=60)
+        self.assertEqual(response.status_code, 200)
+        
+        response = requests.get(
+            f"{self.api_base_url}/stock-statistics",
+            params={"symbol": symbol, "from_date": rows[0]["date"], "limit": 1000}
+        )
+        self.assertEqual(response.status_code, 200)
+        stored = {stat['date']: stat for stat in response.json()}
+        self.assertEqual(len(stored), 1000)
+        
+        for row in rows:
+            stat = stored.get(row['date'])
+            if stat is None:
+                continue
+            self.assertAlmostEqual(stat['current_price'], row['current_price'], places=4)
+            self.assertAlmostEqual(stat['ceiling_price'], row['ceiling_price'], places=4)
+            self.assertEqual(stat['volume'], row['volume'])
+            self.assertEqual(stat['foreign_buy_vol_total'], row['foreign_buy_vol_total'])
+            # Generated columns: foreign buy minus foreign sell
+            self.assertEqual(stat['net_buy_sell_vol'], row['foreign_buy_vol_total'] - row['foreign_sell_vol_total'])
+            self.assertEqual(stat['net_buy_sell_val'], row['foreign_buy_val_total'] - row['foreign_sell_val_total'])
+        
+        response = requests.get(f"{self.api_base_url}/stock-statistics/stats", params={"symbol": symbol})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total_records'], 1200)
+        self.assertEqual(response.json()['duplicate_records'], 0)
+    
+    def _seed_read_test_rows(self):
+        """Store three known statistics rows for the read endpoint tests"""
+        symbol = "READ_TEST"
+        response = requests.post(f"{self.api_base_url}/companies", json={
+            "symbol": symbol,
+            "company_name": "Read Endpoints Test Company"
+        })
+        self.assertEqual(response.status_code, 200)
+        
+        rows = [
+            {"symbol": symbol, "date": "2020-03-02", "current_price": 20.5, "foreign_buy_vol_total": 500, "foreign_sell_vol_total": 200},
+            {"symbol": symbol, "date": "2020-03-03", "current_price": 21.0, "foreign_buy_vol_total": 100, "foreign_sell_vol_total": 400},
+            {"symbol": symbol, "date": "2020-03-04", "current_price": 21.5, "foreign_buy_vol_total": 0, "foreign_sell_vol_total": 0}
+        ]
+        response = requests.post(f"{self.api_base_url}/stock-statistics/bulk", json=rows)
+        self.assertEqual(response.status_code, 200)
+        return symbol, rows, response
+    
+    def test_11_bulk_statistics_small_batch(self):
+        """Test bulk statistics upsert below the COPY threshold"""
+        symbol, rows, response = self._seed_read_test_rows()
+        self.assertEqual(response.json(), {"upserted": 3, "symbols": [symbol]})
+        
+        response = requests.get(f"{self.api_base_url}/stock-statistics", params={"symbol": symbol})
+        self.assertEqual(response.status_code, 200)
+        stored = {stat['date']: stat for stat in response.json()}
+        for row in rows:
+            self.assertAlmostEqual(stored[row['date']]['current_price'], row['current_price'], places=4)
+            self.assertEqual(stored[row['date']]['net_buy_sell_vol'], row['foreign_buy_vol_total'] - row['foreign_sell_vol_total'])
+        
+        # Empty batches are rejected
+        response = requests.post(f"{self.api_base_url}/stock-statistics/bulk", json=[])
+        self.assertEqual(response.status_code, 400)
+    
+    def test_12_statistics_dates_and_cache(self):
+        """Test stored dates endpoint and cache invalidation after a write"""
+        symbol, rows, _ = self._seed_read_test_rows()
+        
+        response = requests.get(f"{self.api_base_url}/stock-statistics/dates", params={"symbol": symbol})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), ["2020-03-04", "2020-03-03", "2020-03-02"])
+        
+        response = requests.get(
+            f"{self.api_base_url}/stock-statistics/dates",
+            params={"symbol": symbol, "from_date": "2020-03-03", "to_date": "2020-03-03"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), ["2020-03-03"])
+        
+        # Read twice so the second response comes from the cache, then write a new price
+        params = {"symbol": symbol, "from_date": "2020-03-04", "to_date": "2020-03-04"}
+        for _ in range(2):
+            response = requests.get(f"{self.api_base_url}/stock-statistics", params=params)
+            self.assertEqual(response.status_code, 200)
+            self.assertAlmostEqual(response.json()[0]['current_price'], 21.5, places=4)
+        
+        new_price = round(30 + time.time() % 10, 2)
+        response = requests.post(f"{self.api_base_url}/stock-statistics/bulk", json=[dict(rows[2], current_price=new_price)])
+        self.assertEqual(response.status_code, 200)
+        
+        response = requests.get(f"{self.api_base_url}/stock-statistics", params=params)
+        self.assertEqual(response.status_code, 200)
+        self.assertAlmostEqual(response.json()[0]['current_price'], new_price, places=4)
+    
+    def test_13_statistics_stats_summary(self):
+        """Test per-symbol row and distinct date counts"""
+        symbol, rows, _ = self._seed_read_test_rows()
+        
+        response = requests.get(f"{self.api_base_url}/stock-statistics/stats", params={"symbol": symbol})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            "symbol": symbol,
+            "total_records": len(rows),
+            "unique_dates": len(rows),
+            "duplicate_records": 0
+        })
+        
+        # Symbols without data report zero counts
+        response = requests.get(f"{self.api_base_url}/stock-statistics/stats", params={"symbol": "NODATA_TST"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total_records'], 0)
+        self.assertEqual(response.json()['duplicate_records'], 0)
+    
+    def test_14_statistics_last_update(self):
+        """Test latest stored date lookup for several symbols at once"""
+        symbol, rows, _ = self._seed_read_test_rows()
+        
+        response = requests.get(
+            f"{self.api_base_url}/stock-statistics/last-update",
+            params={"symbols": f"{symbol},NODATA_TST"}
+        )
+        self.assertEqual(response.status_code, 200)
+        # Symbols without stored rows are omitted
+        self.assertEqual(response.json(), {symbol: max(row['date'] for row in rows)})
+        
+        response = requests.get(f"{self.api_base_url}/stock-statistics/last-update")
+        self.assertEqual(response.status_code, 422)
+    
+    def test_15_proxy_batch_symbol_limit(self):
+        """Test the symbol limit on SSI proxy batch endpoints"""
+        try:
+            requests.get(f"{self.proxy_base_url}/health", timeout=5)
+        except requests.exceptions.RequestException:
+            self.skipTest("SSI proxy not running")
+        
+        too_many = ",".join(f"S{i:03d}" for i in range(51))
+        requests_by_endpoint = {
+            "stock-info/batch": {"from_date": "01/01/2024", "to_date": "31/01/2024"},
+            "charts-history/batch": {"from_timestamp": 1704067200, "to_timestamp": 1706659200}
+        }
+        
+        for endpoint, params in requests_by_endpoint.items():
+            # Rejected before any SSI request is made
+            response = requests.get(f"{self.proxy_base_url}/ssi-proxy/{endpoint}", params=dict(params, symbols=too_many))
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("50", response.json()['detail'])
+            
+            response = requests.get(f"{self.proxy_base_url}/ssi-proxy/{endpoint}", params=dict(params, symbols=" , ,"))
+            self.assertEqual(response.status_code, 400)
 
 if __name__ == "__main__":
     # Create test suite